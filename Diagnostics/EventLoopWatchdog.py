@@ -0,0 +1,82 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+class EventLoopWatchdog(QObject):
+    """
+    Class for detecting blocked Qt event loop. Timer in GUI thread stores heartbeat time, background thread logs
+    stack of GUI thread when heartbeat is late by more than threshold, duration of stall is logged when loop resumes
+    """
+    HEARTBEAT_INTERVAL = 50  # Time in [ms] between heartbeats
+    BLOCK_THRESHOLD_DEFAULT = 0.2  # Time in [s] of missing heartbeat treated as blocked event loop
+
+    def __init__(self, threshold: float = BLOCK_THRESHOLD_DEFAULT, parent: QObject = None):
+        """
+        Class initialization, must be called from GUI thread
+        :param threshold: time in [s] of missing heartbeat treated as blocked event loop
+        :param parent: parent QObject
+        """
+        super(EventLoopWatchdog, self).__init__(parent)
+        self.threshold = threshold
+        self.gui_thread_id = threading.get_ident()
+        self.heartbeat_time = time.monotonic()
+        self.stall_reported = False  # True if current stall was already logged by monitor thread
+        self.stalls = 0  # Number of detected stalls
+        self.stall_max = 0.0  # Longest detected stall in [s]
+        self.stop_event = threading.Event()
+        self.monitor_thread = None
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(self.HEARTBEAT_INTERVAL)
+        self.heartbeat_timer.timeout.connect(self.heartbeat)
+
+    def start(self):
+        """
+        Start heartbeat timer and monitor thread
+        """
+        self.heartbeat_time = time.monotonic()
+        self.stop_event.clear()
+        self.heartbeat_timer.start()
+        self.monitor_thread = threading.Thread(target=self.__monitor, name='event-loop-watchdog', daemon=True)
+        self.monitor_thread.start()
+
+    def stop(self):
+        """
+        Stop heartbeat timer and monitor thread
+        """
+        self.heartbeat_timer.stop()
+        self.stop_event.set()
+        if self.monitor_thread is not None:
+            self.monitor_thread.join()
+            self.monitor_thread = None
+
+    def heartbeat(self):
+        """
+        Store heartbeat time, triggered by timer in GUI thread
+        """
+        now = time.monotonic()
+        stall = now - self.heartbeat_time - self.HEARTBEAT_INTERVAL / 1000
+        if stall > self.threshold:
+            self.stalls += 1
+            self.stall_max = max(self.stall_max, stall)
+            logging.warning(f"Event loop was blocked for {stall * 1000:.0f} ms")
+        self.heartbeat_time = now
+        self.stall_reported = False
+
+    def __monitor(self):
+        """
+        Log stack of GUI thread once per stall while heartbeat is late, runs in background thread
+        """
+        check_interval = min(self.threshold, self.HEARTBEAT_INTERVAL / 1000)
+        while not self.stop_event.wait(check_interval):
+            stall = time.monotonic() - self.heartbeat_time - self.HEARTBEAT_INTERVAL / 1000
+            if stall > self.threshold and not self.stall_reported:
+                self.stall_reported = True
+                frame = sys._current_frames().get(self.gui_thread_id)
+                stack = ''.join(traceback.format_stack(frame)) if frame is not None else ''
+                logging.warning(f"Event loop blocked for more than {self.threshold * 1000:.0f} ms in:\n{stack}")
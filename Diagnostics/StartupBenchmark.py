@@ -0,0 +1,53 @@
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_BUDGET = 1.5  # Time in [s] from interpreter start to first shown main window
+RUNS = 5  # Number of measured application starts
+DEFERRED_MODULES = ('pyvisa', 'picosdk', 'pyqtgraph', 'DriverThreads.RigolDP832Thread')  # Modules that must not load on start
+
+# Code run in fresh interpreter: main window is created and shown, time is taken after first event loop pass
+STARTUP_CODE = """
+import sys, time
+start_time = time.perf_counter()
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+import qdarkstyle
+from application import MainWindow
+import_time = time.perf_counter() - start_time
+app = QApplication(sys.argv)
+app.setStyleSheet(qdarkstyle.load_stylesheet())
+window = MainWindow()
+window.show()
+QTimer.singleShot(0, app.quit)
+app.exec_()
+startup_time = time.perf_counter() - start_time
+window.event_loop_watchdog.stop()
+loaded = [name for name in {deferred} if name in sys.modules]
+print(f"{{import_time}} {{startup_time}} {{','.join(loaded)}}")
+""".format(deferred=DEFERRED_MODULES)
+
+
+def startup_measure() -> (float, float, [str]):
+    """
+    Start application in fresh interpreter and measure time to first shown main window
+    :return: tuple of (import time in [s], startup time in [s], deferred modules loaded on start)
+    """
+    result = subprocess.run([sys.executable, '-c', STARTUP_CODE], cwd=REPO_PATH, capture_output=True, text=True,
+                            check=True)
+    import_time, startup_time, loaded = result.stdout.strip('\n').splitlines()[-1].split(' ')
+    return float(import_time), float(startup_time), [name for name in loaded.split(',') if name]
+
+
+if __name__ == "__main__":
+    samples = [startup_measure() for _ in range(RUNS)]  # First run includes cold disk and bytecode caches
+    startup_times = [startup_time for _, startup_time, _ in samples]
+    print(f"Import time:  median {statistics.median(sample[0] for sample in samples) * 1000:.0f} ms")
+    print(f"Startup time: first {startup_times[0] * 1000:.0f} ms, median {statistics.median(startup_times) * 1000:.0f} ms,"
+          f" max {max(startup_times) * 1000:.0f} ms, budget {STARTUP_BUDGET * 1000:.0f} ms")
+    loaded = sorted({name for _, _, names in samples for name in names})
+    if loaded:
+        print(f"Modules loaded on start that should be deferred: {', '.join(loaded)}")
+    sys.exit(0 if max(startup_times) <= STARTUP_BUDGET and not loaded else 1)
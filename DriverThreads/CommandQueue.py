@@ -0,0 +1,93 @@
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+
+from Drivers.RigolDP832.RIGOL832 import CommandTimingStats
+
+
+class CommandPriorities(IntEnum):
+    """
+    Class for storing priorities of worker commands, lower value is executed first
+    """
+    SAFETY = 0  # Output OFF, OVP/OCP on/off
+    SETPOINT = 1  # Voltage/current set values, output ON
+    POLL = 2  # Background measurements
+
+
+@dataclass
+class CommandQueueMetrics:
+    """
+    Class for storing command queue statistics
+    """
+    depth: int = 0  # Number of commands waiting in queue
+    depth_max: int = 0  # Highest number of commands waiting in queue
+    dropped: int = 0  # Number of poll commands dropped as stale
+    wait_stats: dict = field(default_factory=dict)  # CommandPriorities: CommandTimingStats of time spent in queue
+
+
+class CommandQueue:
+    """
+    Class for ordering worker commands by priority, commands of the same priority keep their order.
+    Poll commands are named, poll already waiting in queue is not queued again, and polls are dropped when queue is deep
+    """
+    POLL_DROP_DEPTH = 4  # Number of queued commands at which new poll commands are dropped
+
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.lock = threading.Lock()
+        self.heap = []
+        self.counter = itertools.count()
+        self.polls_queued = set()
+        self.metrics = CommandQueueMetrics(wait_stats={priority: CommandTimingStats() for priority in CommandPriorities})
+
+    def put(self, priority: CommandPriorities, name: str, function, *args) -> bool:
+        """
+        Queue command
+        :param priority: priority of command
+        :param name: name of command, used to detect stale polls
+        :param function: callable executed by worker
+        :param args: arguments of callable
+        :return: True if command was queued, False if it was dropped
+        """
+        with self.lock:
+            if priority == CommandPriorities.POLL:
+                if name in self.polls_queued or len(self.heap) >= self.POLL_DROP_DEPTH:
+                    self.metrics.dropped += 1
+                    return False
+                self.polls_queued.add(name)
+            heapq.heappush(self.heap, (priority, next(self.counter), time.monotonic(), name, function, args))
+            self.metrics.depth = len(self.heap)
+            self.metrics.depth_max = max(self.metrics.depth_max, self.metrics.depth)
+        return True
+
+    def take(self):
+        """
+        Remove command with highest priority from queue
+        :return: tuple of (function, args), None if queue is empty
+        """
+        with self.lock:
+            if len(self.heap) == 0:
+                return None
+            priority, _, queued_time, name, function, args = heapq.heappop(self.heap)
+            if priority == CommandPriorities.POLL:
+                self.polls_queued.discard(name)
+            self.metrics.depth = len(self.heap)
+            self.metrics.wait_stats[priority].register(time.monotonic() - queued_time)
+        return function, args
+
+    def metrics_get(self) -> CommandQueueMetrics:
+        """
+        Return copy of queue statistics
+        :return: queue depth, dropped polls and wait time statistics for every priority
+        """
+        with self.lock:
+            return CommandQueueMetrics(self.metrics.depth, self.metrics.depth_max, self.metrics.dropped,
+                                       {priority: replace(stats) for priority, stats in self.metrics.wait_stats.items()})
+
+    def __len__(self):
+        return len(self.heap)
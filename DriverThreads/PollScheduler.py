@@ -0,0 +1,140 @@
+import time
+
+
+class PollTask:
+    """
+    Class for storing polling rate of single measured quantity
+    """
+    def __init__(self, interval_min: int, interval_max: int, change_threshold: float = 0.0):
+        """
+        Class initialization
+        :param interval_min: polling interval in [ms] used during transients
+        :param interval_max: polling interval in [ms] used when readings are flat or nothing is polled
+        :param change_threshold: smallest difference between readings treated as change
+        """
+        if not 0 < interval_min <= interval_max:
+            raise ValueError("Error: Polling intervals must be positive and interval_min <= interval_max")
+        self.interval_min = interval_min
+        self.interval_max = interval_max
+        self.change_threshold = change_threshold
+        self.interval = interval_min
+        self.last_values = None
+
+
+class PollScheduler:
+    """
+    Class for choosing polling interval of every measured quantity. Interval drops to minimum when readings change
+    or user command was issued and grows geometrically up to maximum while readings stay flat
+    """
+    BACKOFF_FACTOR = 1.5  # Interval multiplier applied after every poll with flat readings
+    CHANNEL_HOLD_TIME = 3.0  # Time in [s] channel is polled after user command, even if it is disabled
+
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.tasks = {}
+        self.channels_enabled = set()  # Channels with output turned ON
+        self.channels_plotted = set()  # Channels shown on plot
+        self.channels_touched = {}  # Channel: time.monotonic() of last user command
+
+    def task_add(self, name: str, interval_min: int, interval_max: int, change_threshold: float = 0.0):
+        """
+        Register measured quantity
+        :param name: name of quantity
+        :param interval_min: polling interval in [ms] used during transients
+        :param interval_max: polling interval in [ms] used when readings are flat or nothing is polled
+        :param change_threshold: smallest difference between readings treated as change
+        """
+        self.tasks[name] = PollTask(interval_min, interval_max, change_threshold)
+
+    def interval(self, name: str) -> int:
+        """
+        Return current polling interval of quantity
+        :param name: name of quantity
+        :return: polling interval in [ms]
+        """
+        return int(self.tasks[name].interval)
+
+    def readings_register(self, name: str, values) -> int:
+        """
+        Compare readings with previous ones and adapt polling interval of quantity
+        :param name: name of quantity
+        :param values: sequence of readings, numbers are compared with threshold, other values must be equal
+        :return: new polling interval in [ms]
+        """
+        task = self.tasks[name]
+        values = tuple(values)
+        if self.__changed(task, values):
+            task.interval = task.interval_min
+        else:
+            task.interval = min(task.interval * self.BACKOFF_FACTOR, task.interval_max)
+        task.last_values = values
+        return self.interval(name)
+
+    @staticmethod
+    def __changed(task: PollTask, values: tuple) -> bool:
+        """
+        Check if readings differ from previous ones
+        :param task: polled quantity
+        :param values: new readings
+        :return: True if any reading changed
+        """
+        if task.last_values is None or len(task.last_values) != len(values):
+            return True
+        for previous, value in zip(task.last_values, values):
+            if isinstance(value, float):
+                if abs(value - previous) > task.change_threshold:
+                    return True
+            elif value != previous:
+                return True
+        return False
+
+    def idle(self, name: str) -> int:
+        """
+        Set polling interval of quantity to maximum, used when there is nothing to poll
+        :param name: name of quantity
+        :return: new polling interval in [ms]
+        """
+        task = self.tasks[name]
+        task.interval = task.interval_max
+        task.last_values = None
+        return self.interval(name)
+
+    def boost(self, channel: int = None):
+        """
+        Set polling interval of all quantities to minimum, used after user command
+        :param channel: channel that command was sent to, it is polled for CHANNEL_HOLD_TIME
+        """
+        for task in self.tasks.values():
+            task.interval = task.interval_min
+        if channel is not None:
+            self.channels_touched[channel] = time.monotonic()
+
+    def channel_enabled_set(self, channel: int, enabled: bool):
+        """
+        Store output state of channel
+        :param channel: specific channel to interact with
+        :param enabled: True if output is turned ON
+        """
+        if enabled:
+            self.channels_enabled.add(channel)
+        else:
+            self.channels_enabled.discard(channel)
+
+    def channels_plotted_set(self, channels):
+        """
+        Store channels shown on plot
+        :param channels: iterable of plotted channels
+        """
+        self.channels_plotted = set(channels)
+
+    def channels_polled(self) -> [int]:
+        """
+        Return channels that should be polled: enabled, plotted or recently commanded
+        :return: sorted list of channels
+        """
+        now = time.monotonic()
+        touched = {channel for channel, timestamp in self.channels_touched.items()
+                   if now - timestamp < self.CHANNEL_HOLD_TIME}
+        return sorted(self.channels_enabled | self.channels_plotted | touched)
@@ -1,169 +1,434 @@
+import logging
 import time
+from dataclasses import dataclass
+
+import numpy
+import pyvisa
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
+from DriverThreads.PollScheduler import PollScheduler
+from Drivers.VisaConnectionPool import VisaConnectionPool
+from DriverThreads.CommandQueue import CommandQueue, CommandPriorities, CommandQueueMetrics
+from Drivers.RigolDP832.RIGOL832 import RigolDP832, RigolDP832StateFields, RigolDP832Snapshot, PowerSupplyMeas
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputModes as OutputModes
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputStates as OutputStates
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputProtectionStates as OutputProtectionStates
+
+
+@dataclass(frozen=True, eq=False)
+class RigolDP832Measurement:
+    """
+    Class for sending measured values of all channels, index 0 of every tuple or array holds first channel.
+    Row starts with time followed by voltages and currents, so its prefix is a sample of plot history
+    """
+    row: numpy.ndarray  # Read-only row of time in [s], voltages in [V], currents in [A] and powers in [W]
+    ovp_tripped: tuple  # True if OVP of channel tripped
+    ocp_tripped: tuple  # True if OCP of channel tripped
+
+    @property
+    def timestamp(self) -> float:
+        return float(self.row[0])
 
-from PyQt5.QtCore import QObject, pyqtSignal, QMutex, QTimer
-from Drivers.RigolDP832.RIGOL832 import RigolDP832, OutputModes, OutputStates, OutputProtectionStates
+    @property
+    def voltage(self) -> numpy.ndarray:
+        return self.row[1:1 + len(self.ovp_tripped)]
+
+    @property
+    def current(self) -> numpy.ndarray:
+        return self.row[1 + len(self.ovp_tripped):1 + 2 * len(self.ovp_tripped)]
+
+    @property
+    def power(self) -> numpy.ndarray:
+        return self.row[1 + 2 * len(self.ovp_tripped):]
 
 
 class RigolDP832Thread(QObject):
     """
     Class responsible for Rigol DP832 thread
     """
-    measure_values_signal = pyqtSignal()  # Signal used to send information about measured output values
-    mode_read_signal = pyqtSignal()  # Signal used to send information about output mode
-
-    mutex = QMutex()  # Mutex used to prevent Rigol DP832 thread functions overlaping
-
-    MEASURE_VALUES_INTERVAL = 300  # Time in [ms]
-    READ_MODE_INTERVAL = 2000  # Time in [ms]
-
-    def __init__(self, channels_quantity: int, address='USB0::0x1AB1::0x0E11::DP8C193604338::INSTR'):
+    measure_values_signal = pyqtSignal(object)  # Signal used to send RigolDP832Measurement of measured output values
+    mode_read_signal = pyqtSignal(object)  # Signal used to send tuple of RigolDP832OutputModes of all channels on change
+    cache_reconcile_requested = pyqtSignal()  # Signal used by getters called from GUI thread to queue cache refresh
+
+    MEASURE_VALUES_INTERVAL_MIN = 100  # Time in [ms] used during transients
+    MEASURE_VALUES_INTERVAL_MAX = 2000  # Time in [ms] used when readings are flat or no channel is polled
+    MEASURE_VALUES_THRESHOLD = 0.005  # Smallest change of voltage in [V] or current in [A] treated as transient
+    POLL_VALUES = 'values'  # Name of measured values and status polling task
+    POLL_CACHE_RECONCILE = 'reconcile'  # Name of state cache refresh task
+    WRITE_SETTINGS = 'write'  # Name of queued settings write command
+    CLEAR_TRIPS = 'clear_trips'  # Name of queued protection trip clear command
+    SAFETY_FIELDS = (RigolDP832StateFields.OVP_STATE, RigolDP832StateFields.OCP_STATE)  # Settings written with priority
+    CACHE_RECONCILE_INTERVAL = 10000  # Time in [ms]
+    WRITE_COALESCE_INTERVAL = 50  # Time in [ms] to collect setting changes before writing them as one batch
+
+    def __init__(self, channels_quantity: int, address='USB0::0x1AB1::0x0E11::DP8C193604338::INSTR',
+                 initial_snapshot: RigolDP832Snapshot = None):
         """
         Class initialization
+        :param channels_quantity: number of channels of power supply
+        :param address: address of power supply
+        :param initial_snapshot: state of power supply read by snapshot_read, instrument is queried if None
         """
         super(RigolDP832Thread, self).__init__()
         if channels_quantity != RigolDP832.CHANNEL_MAX:
             raise Exception("Invalid number of channels")
 
         self.channels_quantity = channels_quantity
+        self.address = address
+        self.mutex = VisaConnectionPool.resource_lock(address)  # Lock used to prevent Rigol DP832 functions overlaping
         self.Rigol = RigolDP832(address)
-        self.channels_voltage = [0] * self.channels_quantity
-        self.channels_current = [0] * self.channels_quantity
-        self.channels_power = [0] * self.channels_quantity
-        self.channels_voltage_set_value = [self.Rigol.output_voltage_value_get(self.Rigol.CHANNEL_FIRST),
-                                           self.Rigol.output_voltage_value_get(self.Rigol.CHANNEL_SECOND),
-                                           self.Rigol.output_voltage_value_get(self.Rigol.CHANNEL_THIRD)]
-        self.channels_current_set_value = [self.Rigol.output_current_value_get(self.Rigol.CHANNEL_FIRST),
-                                           self.Rigol.output_current_value_get(self.Rigol.CHANNEL_SECOND),
-                                           self.Rigol.output_current_value_get(self.Rigol.CHANNEL_THIRD)]
-        self.timestamp = 0
-        self.channels_mode = [OutputModes.UNREGULATED, OutputModes.UNREGULATED, OutputModes.UNREGULATED]
+        if initial_snapshot is None:
+            initial_snapshot = self.Rigol.snapshot()  # fills state cache, so UI can read settings from memory
+        else:
+            for channel, state in zip(range(self.Rigol.CHANNEL_MIN, self.Rigol.CHANNEL_MAX + 1),
+                                      initial_snapshot.channels):
+                self.Rigol.cache.channel_state_set(channel, state)
+        self.initial_snapshot = initial_snapshot
+        # Back buffers filled by worker, consumers only receive immutable measurement published from them
+        self.measurement_row = numpy.zeros(1 + PowerSupplyMeas.VALUES_QUANTITY * self.channels_quantity)
+        self.measurement_values = self.measurement_row[1:]  # View filled by driver: voltages, currents, powers
+        self.channels_condition_read = numpy.zeros(self.channels_quantity, dtype=int)  # Filled by driver
+        self.channels_condition = [None] * self.channels_quantity  # Last decoded questionable status conditions
+        self.channels_ovp_tripped = [False] * self.channels_quantity
+        self.channels_ocp_tripped = [False] * self.channels_quantity
+        self.channels_voltage_set_value = [state.voltage_set for state in self.initial_snapshot.channels]
+        self.channels_current_set_value = [state.current_set for state in self.initial_snapshot.channels]
+        self.channels_mode = list(self.initial_snapshot.modes)
+        self.measurement = self.measurement_publish()  # Last published measurement
+
+        self.scheduler = PollScheduler()
+        self.scheduler.task_add(self.POLL_VALUES, self.MEASURE_VALUES_INTERVAL_MIN, self.MEASURE_VALUES_INTERVAL_MAX,
+                                self.MEASURE_VALUES_THRESHOLD)
+        self.channels_enabled_update()
+
+        self.command_queue = CommandQueue()
+        self.command_process_timer = QTimer(self)  # Zero timer lets queued signals add commands between executions
+        self.command_process_timer.setSingleShot(True)
+        self.command_process_timer.setInterval(0)
+        self.command_process_timer.timeout.connect(self.command_process)
 
         self.check_thread_timer = QTimer(self)
-        self.check_thread_timer.setInterval(self.MEASURE_VALUES_INTERVAL)
-        self.check_thread_timer.timeout.connect(self.measure_values)
+        self.check_thread_timer.setInterval(self.scheduler.interval(self.POLL_VALUES))
+        self.check_thread_timer.timeout.connect(self.measure_values_queue)
         self.check_thread_timer.start()
 
-        self.mode_measure_timer = QTimer(self)
-        self.mode_measure_timer.setInterval(self.READ_MODE_INTERVAL)
-        self.mode_measure_timer.timeout.connect(self.measure_output_mode)
-        self.mode_measure_timer.start()
+        self.cache_reconcile_timer = QTimer(self)
+        self.cache_reconcile_timer.setInterval(self.CACHE_RECONCILE_INTERVAL)
+        self.cache_reconcile_timer.timeout.connect(self.cache_reconcile_queue)
+        self.cache_reconcile_timer.start()
+        self.cache_reconcile_requested.connect(self.cache_reconcile_queue)
+
+        self.write_flush_timer = QTimer(self)
+        self.write_flush_timer.setSingleShot(True)
+        self.write_flush_timer.setInterval(self.WRITE_COALESCE_INTERVAL)
+        self.write_flush_timer.timeout.connect(self.write_queue_flush_queue)
+        self.safety_flush_queued = False  # True while write of settings is waiting in queue with SAFETY priority
 
         self.time_start = time.time()
 
+    @pyqtSlot()
+    def stop(self):
+        """
+        Stop timers, write settings still waiting in write queue and close driver, must run in worker thread
+        before it is quit
+        """
+        self.check_thread_timer.stop()
+        self.cache_reconcile_timer.stop()
+        self.write_flush_timer.stop()
+        self.command_process_timer.stop()
+        try:
+            self.write_queue_flush()
+        except Exception:
+            logging.exception(f"Rigol DP832 {self.address}: pending settings were not written")
+        with self.mutex:
+            self.Rigol.close()
+
+    @staticmethod
+    def snapshot_read(address: str) -> RigolDP832Snapshot:
+        """
+        Connect to power supply and read its state, used to prepare worker outside of GUI thread
+        :param address: address of power supply
+        :return: immutable state of power supply, pass it to worker as initial_snapshot
+        """
+        with VisaConnectionPool.resource_lock(address):
+            try:
+                return RigolDP832(address).snapshot()
+            except pyvisa.VisaIOError:
+                raise ConnectionError("Can't read power supply state")
+
+    def setting_queue(self, channel: int, field: RigolDP832StateFields, value):
+        """
+        Queue setting write, changes of the same setting made before flush are coalesced into the last one
+        :param channel: specific channel to interact with
+        :param field: setting to be written
+        :param value: new value of setting
+        """
+        self.Rigol.write_queue.put(channel, field, value)
+        if field in self.SAFETY_FIELDS or (field == RigolDP832StateFields.OUTPUT_STATE and value == OutputStates.OFF):
+            self.write_flush_timer.stop()
+            if not self.safety_flush_queued:  # queued flush writes all pending settings, one is enough
+                self.safety_flush_queued = True
+                self.command_put(CommandPriorities.SAFETY, self.WRITE_SETTINGS, self.write_queue_flush)
+        elif not self.write_flush_timer.isActive():
+            self.write_flush_timer.start()
+        if field == RigolDP832StateFields.OUTPUT_STATE:
+            self.scheduler.channel_enabled_set(channel, value == OutputStates.ON)
+        self.scheduler.boost(channel)
+        self.poll_timers_speed_up()
+
+    def command_put(self, priority: CommandPriorities, name: str, function, *args):
+        """
+        Queue command for worker, commands are executed in order of priority
+        :param priority: priority of command
+        :param name: name of command, used to drop stale polls
+        :param function: callable executed by worker
+        :param args: arguments of callable
+        """
+        if self.command_queue.put(priority, name, function, *args) and not self.command_process_timer.isActive():
+            self.command_process_timer.start()
+
+    @pyqtSlot()
+    def command_process(self):
+        """
+        Execute single queued command with highest priority, processing continues after pending signals are handled.
+        Failed command is logged and skipped, so one instrument error doesn't stop the worker
+        """
+        command = self.command_queue.take()
+        if command is not None:
+            function, args = command
+            try:
+                function(*args)
+            except Exception:
+                logging.exception(f"Rigol DP832 {self.address}: command {function.__name__} failed")
+        if len(self.command_queue) > 0:
+            self.command_process_timer.start()
+
+    @pyqtSlot()
+    def measure_values_queue(self):
+        """
+        Queue measurement of output values, triggered by timer
+        """
+        self.command_put(CommandPriorities.POLL, self.POLL_VALUES, self.measure_values)
+
+    @pyqtSlot()
+    def cache_reconcile_queue(self):
+        """
+        Queue state cache refresh, triggered by timer
+        """
+        self.command_put(CommandPriorities.POLL, self.POLL_CACHE_RECONCILE, self.cache_reconcile)
+
+    @pyqtSlot()
+    def write_queue_flush_queue(self):
+        """
+        Queue write of coalesced settings, triggered by timer
+        """
+        self.command_put(CommandPriorities.SETPOINT, self.WRITE_SETTINGS, self.write_queue_flush)
+
+    def queue_metrics(self) -> CommandQueueMetrics:
+        """
+        Return worker command queue statistics
+        :return: queue depth, dropped polls and time commands waited in queue for every priority
+        """
+        return self.command_queue.metrics_get()
+
+    def poll_timers_speed_up(self):
+        """
+        Restart polling timer with minimal interval if it would fire later, so transient is captured
+        """
+        interval = self.scheduler.interval(self.POLL_VALUES)
+        if self.check_thread_timer.remainingTime() > interval:
+            self.check_thread_timer.start(interval)
+
+    def channels_enabled_update(self):
+        """
+        Pass output states stored in driver state cache to polling scheduler
+        """
+        for channel in range(self.Rigol.CHANNEL_MIN, self.Rigol.CHANNEL_MAX + 1):
+            state = self.Rigol.cache.channel_state_get(channel).output_state
+            self.scheduler.channel_enabled_set(channel, state == OutputStates.ON)
+
+    @pyqtSlot(object)
+    def plotted_channels_changed(self, channels):
+        """
+        Triggered when set of channels shown on plot changed
+        :param channels: iterable of plotted channels
+        """
+        self.scheduler.channels_plotted_set(channels)
+        self.scheduler.boost()
+        self.poll_timers_speed_up()
+
+    def write_queue_flush(self):
+        """
+        Write all queued settings to power supply as single batch
+        """
+        self.safety_flush_queued = False
+        with self.mutex:
+            self.Rigol.write_queue_flush()
+
+    @pyqtSlot(bool, int)
     def channel_toggle(self, toggle: bool, channel: int):
         """
         Toggle power supply channel
         :param toggle: set power supply state
         :param channel: specific channel to interact with
         """
+        state = OutputStates.ON if toggle is True else OutputStates.OFF
+        if toggle is True and (self.channels_ovp_tripped[channel-1] or self.channels_ocp_tripped[channel-1]):
+            # latched trip keeps output OFF, it is cleared before queued output ON is written
+            self.command_put(CommandPriorities.SAFETY, self.CLEAR_TRIPS, self.protection_trips_clear, channel)
+        self.setting_queue(channel, RigolDP832StateFields.OUTPUT_STATE, state)
 
-        self.mutex.lock()
-        if toggle is True:
-            self.Rigol.channel_turn_on(channel)
-        else:
-            self.Rigol.channel_turn_off(channel)
-
-        self.mutex.unlock()
-
+    def protection_trips_clear(self, channel: int):
+        """
+        Clear latched OVP and OCP trips of channel
+        :param channel: specific channel to interact with
+        """
+        i = channel - 1
+        with self.mutex:
+            if self.channels_ovp_tripped[i]:
+                self.Rigol.ovp_trip_clear(channel)
+            if self.channels_ocp_tripped[i]:
+                self.Rigol.ocp_trip_clear(channel)
+            self.channels_ovp_tripped[i] = False
+            self.channels_ocp_tripped[i] = False
+            self.channels_condition[i] = None  # condition is decoded again on next poll
+
+    @pyqtSlot(bool, int)
     def ovp_toggle(self, toggle: bool, channel: int):
         """
         Toggle power supply OVP
         :param toggle: set OVP state
         :param channel: specific channel to interact with
         """
-        self.mutex.lock()
-
-        if toggle is True:
-            self.Rigol.ovp_turn_on(channel)
-        else:
-            self.Rigol.ovp_turn_off(channel)
-
-        self.mutex.unlock()
+        state = OutputProtectionStates.ON if toggle is True else OutputProtectionStates.OFF
+        self.setting_queue(channel, RigolDP832StateFields.OVP_STATE, state)
 
+    @pyqtSlot(bool, int)
     def ocp_toggle(self, toggle: bool, channel: int):
         """
         Toggle power supply OCP
         :param toggle: set OCP state
         :param channel: specific channel to interact with
         """
-        self.mutex.lock()
-
-        if toggle is True:
-            self.Rigol.ocp_turn_on(channel)
-        else:
-            self.Rigol.ocp_turn_off(channel)
-
-        self.mutex.unlock()
+        state = OutputProtectionStates.ON if toggle is True else OutputProtectionStates.OFF
+        self.setting_queue(channel, RigolDP832StateFields.OCP_STATE, state)
 
+    @pyqtSlot(int, float)
     def voltage_value_changed(self, channel: int, voltage: float):
         """
         Triggered when voltage spinbox value changed
         :param channel: specific channel to interact with
         :param voltage: value to be set as output voltage in [V]
         """
-        self.mutex.lock()
-        self.Rigol.output_voltage_set(channel, voltage)
-        self.mutex.unlock()
+        self.setting_queue(channel, RigolDP832StateFields.VOLTAGE_SET, voltage)
 
+    @pyqtSlot(int, float)
     def current_value_changed(self, channel: int, current: float):
         """
         Triggered when current spinbox value changed
         :param channel: specific channel to interact with
         :param current: value to be set as output current in [A]
         """
-        self.mutex.lock()
-        self.Rigol.output_current_set(channel, current)
-        self.mutex.unlock()
+        self.setting_queue(channel, RigolDP832StateFields.CURRENT_SET, current)
 
+    @pyqtSlot(int, float)
     def ovp_value_changed(self, channel: int, voltage: float):
         """
         Triggered when OVP spinbox value changed
         :param channel: specific channel to interact with
         :param voltage: value to be set as OVP in [V]
         """
-        self.mutex.lock()
-        self.Rigol.ovp_value_set(channel, voltage)
-        self.mutex.unlock()
+        self.setting_queue(channel, RigolDP832StateFields.OVP_VALUE, voltage)
 
+    @pyqtSlot(int, float)
     def ocp_value_changed(self, channel: int, current: float):
         """
         Triggered when OCP spinbox value changed
         :param channel: specific channel to interact with
         :param current: value to be set as OCP in [A]
         """
-        self.mutex.lock()
-        self.Rigol.ocp_value_set(channel, current)
-        self.mutex.unlock()
+        self.setting_queue(channel, RigolDP832StateFields.OCP_VALUE, current)
 
     def measure_values(self):
         """
-        Measure values of all channels and store them in variables
-        """
-        self.mutex.lock()
-
-        for i in range(self.channels_quantity):
-            measurements = self.Rigol.measure_all_values(i+1)
-            self.channels_voltage[i] = measurements.voltage
-            self.channels_current[i] = measurements.current
-            self.channels_power[i] = measurements.power
+        Measure values, output modes and protection trips of polled channels in single transaction and store them
+        in preallocated back buffers, readings of other channels are zeroed
+        """
+        channels = self.scheduler.channels_polled()
+        modes_changed = False
+        with self.mutex:
+            self.measurement_values.fill(0)
+            self.Rigol.measure_channels_status_into(channels, self.measurement_values, self.channels_condition_read)
+            for channel in channels:
+                i = channel - 1
+                condition = int(self.channels_condition_read[i])
+                if condition != self.channels_condition[i]:  # condition is decoded only when it changes
+                    self.channels_condition[i] = condition
+                    status = self.Rigol.channel_status_parse(condition)
+                    if status.mode != self.channels_mode[i]:
+                        self.channels_mode[i] = status.mode
+                        modes_changed = True
+                    tripped = (status.ovp_tripped and not self.channels_ovp_tripped[i]) or \
+                        (status.ocp_tripped and not self.channels_ocp_tripped[i])
+                    self.channels_ovp_tripped[i] = status.ovp_tripped
+                    self.channels_ocp_tripped[i] = status.ocp_tripped
+                    if tripped:  # protection turned output OFF, trip stays latched until it is cleared
+                        self.Rigol.cache.update(channel, RigolDP832StateFields.OUTPUT_STATE, OutputStates.OFF)
+                        self.scheduler.channel_enabled_set(channel, False)
+
+        self.measurement_row[0] = round(time.time() - self.time_start, 5)  # Rounding to 0.1 ms
+        self.measurement = self.measurement_publish()
+        self.measure_values_signal.emit(self.measurement)
+        if modes_changed:
+            self.mode_read_signal.emit(tuple(self.channels_mode))
+
+        if channels:
+            readings = self.measurement_values[:2 * self.channels_quantity].tolist()  # voltages and currents
+            interval = self.scheduler.readings_register(self.POLL_VALUES, channels + readings + self.channels_mode)
+        else:
+            interval = self.scheduler.idle(self.POLL_VALUES)
+        self.check_thread_timer.setInterval(interval)
 
-        self.timestamp = round(time.time() - self.time_start, 5)  # Rounding to 0.1 ms
-        self.measure_values_signal.emit()
-        self.mutex.unlock()
+    def measurement_publish(self) -> RigolDP832Measurement:
+        """
+        Create immutable measurement from back buffers, row is copied once because consumers run in other threads
+        :return: measurement of all channels
+        """
+        row = self.measurement_row.copy()
+        row.flags.writeable = False
+        return RigolDP832Measurement(row, tuple(self.channels_ovp_tripped), tuple(self.channels_ocp_tripped))
 
-    def measure_output_mode(self):
+    def cache_reconcile(self):
         """
-        Read output mode of all channels
+        Refresh driver state cache with settings read from instrument
         """
-        self.mutex.lock()
+        with self.mutex:
+            self.Rigol.cache_reconcile()
+        self.channels_enabled_update()
 
-        for i in range(self.channels_quantity):
-            mode = self.Rigol.channel_mode_read(i+1)
-            if mode != self.channels_mode[i]:
-                self.channels_mode[i] = mode
-                self.mode_read_signal.emit()
+    def cached_snapshot(self) -> RigolDP832Snapshot:
+        """
+        Return state of power supply from driver state cache and last read output modes, instrument is not queried
+        :return: immutable state of power supply
+        """
+        states = tuple(self.Rigol.cache.channel_state_get(channel)
+                       for channel in range(self.Rigol.CHANNEL_MIN, self.Rigol.CHANNEL_MAX + 1))
+        return RigolDP832Snapshot(time.monotonic(), states, tuple(self.channels_mode))
 
-        self.mutex.unlock()
+    def cached_value_read(self, index: int, field: RigolDP832StateFields):
+        """
+        Read setting from driver state cache, instrument is never queried, so it can be called from GUI thread.
+        Value waiting in write queue is returned before cached one. Cache refresh is queued in worker
+        if setting is not known yet
+        :param index: index of channel to interact with
+        :param field: setting to be read
+        :return: value of setting, None if not known yet
+        """
+        value = self.Rigol.write_queue.get(index+1, field)
+        if value is None:
+            value = self.Rigol.cache.get(index+1, field)
+        if value is None:
+            self.cache_reconcile_requested.emit()
+        return value
 
     def output_status_read(self, index: int) -> OutputStates:
         """
@@ -171,16 +436,10 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: state of selected channel output
         """
-        self.mutex.lock()
-
-        status = self.Rigol.channel_status_read(index+1)
-        if status == f"{OutputStates.ON.value}\n":
-
-            self.mutex.unlock()
+        status = self.cached_value_read(index, RigolDP832StateFields.OUTPUT_STATE)
+        if status == OutputStates.ON:
             return OutputStates.ON
         else:
-
-            self.mutex.unlock()
             return OutputStates.OFF
 
     def ovp_status_read(self, index: int) -> OutputProtectionStates:
@@ -189,12 +448,7 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: state of selected channel OVP
         """
-        self.mutex.lock()
-
-        status = self.Rigol.ovp_status_read(index+1)
-
-        self.mutex.unlock()
-        return status
+        return self.cached_value_read(index, RigolDP832StateFields.OVP_STATE)
 
     def ocp_status_read(self, index: int) -> OutputProtectionStates:
         """
@@ -202,12 +456,7 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: state of selected channel OCP
         """
-        self.mutex.lock()
-
-        status = self.Rigol.ocp_status_read(index+1)
-
-        self.mutex.unlock()
-        return status
+        return self.cached_value_read(index, RigolDP832StateFields.OCP_STATE)
 
     def ovp_value_read(self, index: int) -> float:
         """
@@ -215,12 +464,7 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: value of selected channel OVP in [V]
         """
-        self.mutex.lock()
-
-        voltage = self.Rigol.ovp_value_get(index+1)
-
-        self.mutex.unlock()
-        return voltage
+        return self.cached_value_read(index, RigolDP832StateFields.OVP_VALUE)
 
     def ocp_value_read(self, index: int) -> float:
         """
@@ -228,12 +472,7 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: value of selected channel OCP in [A]
         """
-        self.mutex.lock()
-
-        current = self.Rigol.ocp_value_get(index+1)
-
-        self.mutex.unlock()
-        return current
+        return self.cached_value_read(index, RigolDP832StateFields.OCP_VALUE)
 
     def output_voltage_value_get(self, index: int) -> float:
         """
@@ -241,12 +480,7 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: output voltage in [V] of selected channel
         """
-        self.mutex.lock()
-
-        voltage = self.Rigol.output_voltage_value_get(index+1)
-
-        self.mutex.unlock()
-        return voltage
+        return self.cached_value_read(index, RigolDP832StateFields.VOLTAGE_SET)
 
     def output_current_value_get(self, index: int) -> float:
         """
@@ -254,9 +488,4 @@ class RigolDP832Thread(QObject):
         :param index: index of channel to interact with
         :return: output current in [A] of selected channel
         """
-        self.mutex.lock()
-
-        current = self.Rigol.output_current_value_get(index+1)
-
-        self.mutex.unlock()
-        return current
+        return self.cached_value_read(index, RigolDP832StateFields.CURRENT_SET)
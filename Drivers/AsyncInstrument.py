@@ -0,0 +1,140 @@
+import asyncio
+import contextlib
+import functools
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from Drivers.VisaConnectionPool import VisaConnectionPool
+
+
+class AsyncInstrument(ABC):
+    """
+    Base class of asyncio facades. Every blocking driver call runs in single-thread executor shared by all facades
+    of the same device and holds resource lock of device address, so calls to one device keep their order and never
+    overlap with GUI worker or other facades, while calls to different devices overlap
+    """
+    DRIVER_CLASS = None  # Blocking driver class wrapped by facade
+    ADDRESS_ATTRIBUTE = 'address'  # Driver attribute holding VISA address, None if device is not VISA instrument
+
+    __executors = {}  # Device key: [executor, number of facades using it]
+    __executors_lock = threading.Lock()
+
+    def __init__(self, driver, executor: ThreadPoolExecutor = None):
+        """
+        Class initialization
+        :param driver: connected blocking driver instance
+        :param executor: executor to run driver calls in, executor shared by device is used if None
+        """
+        self.driver = driver
+        self.address = getattr(driver, self.ADDRESS_ATTRIBUTE) if self.ADDRESS_ATTRIBUTE is not None else None
+        self.key = self.address if self.address is not None else type(driver).__name__
+        self.lock = VisaConnectionPool.resource_lock(self.address) if self.address is not None else None
+        self.executor_owned = executor is None
+        if executor is None:
+            executor = self.__executor_acquire(self.key)
+        self.executor = executor
+
+    @classmethod
+    def __executor_acquire(cls, key: str) -> ThreadPoolExecutor:
+        """
+        Return single-thread executor of device, it is created for first facade
+        :param key: address of device or driver class name
+        :return: executor shared by all facades of device
+        """
+        with cls.__executors_lock:
+            entry = cls.__executors.get(key)
+            if entry is None:
+                entry = cls.__executors[key] = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=key), 0]
+            entry[1] += 1
+            return entry[0]
+
+    @classmethod
+    def __executor_release(cls, key: str):
+        """
+        Release executor of device, it is stopped after pending calls when last facade is closed
+        :param key: address of device or driver class name
+        """
+        with cls.__executors_lock:
+            entry = cls.__executors[key]
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del cls.__executors[key]
+        entry[0].shutdown(wait=True)
+
+    @classmethod
+    async def connect(cls, *args, **kwargs):
+        """
+        Create driver in background thread, so connecting doesn't block event loop
+        :param args: arguments passed to driver class
+        :param kwargs: keyword arguments passed to driver class
+        :return: facade of connected driver
+        """
+        driver = await asyncio.wrap_future(VisaConnectionPool.run_async(cls.DRIVER_CLASS, *args, **kwargs))
+        return cls(driver)
+
+    def __locked_call(self, function, *args, **kwargs):
+        """
+        Call blocking function with resource lock of device held, runs in device executor
+        :param function: function to be called
+        :param args: arguments passed to function
+        :param kwargs: keyword arguments passed to function
+        :return: value returned by function
+        """
+        with self.lock if self.lock is not None else contextlib.nullcontext():
+            return function(*args, **kwargs)
+
+    async def call(self, function, *args, **kwargs):
+        """
+        Run blocking function in device executor
+        :param function: function to be called
+        :param args: arguments passed to function
+        :param kwargs: keyword arguments passed to function
+        :return: value returned by function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(self.__locked_call, function,
+                                                                           *args, **kwargs))
+
+    @abstractmethod
+    async def poll(self):
+        """
+        Read main measurement of device, implemented by every facade
+        """
+
+    def close(self):
+        """
+        Wait for pending calls, device executor is stopped when last facade of device is closed
+        """
+        if self.executor_owned:
+            self.executor_owned = False
+            self.__executor_release(self.key)
+
+    def __getattr__(self, name: str):
+        """
+        Expose public driver methods as coroutine functions, other attributes are returned as they are
+        """
+        attribute = getattr(self.driver, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+            return await self.call(attribute, *args, **kwargs)
+        return method
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+async def poll_instruments(*instruments: AsyncInstrument) -> list:
+    """
+    Poll many instruments at once, bus latency of different devices overlaps
+    :param instruments: facades to be polled
+    :return: list of poll results in order of instruments
+    """
+    return list(await asyncio.gather(*(instrument.poll() for instrument in instruments)))
@@ -0,0 +1,17 @@
+from Drivers.AsyncInstrument import AsyncInstrument
+from Drivers.Keithley2308.Keithley2308 import Keithley2308
+
+
+class AsyncKeithley2308(AsyncInstrument):
+    """
+    Class for controlling Keithley 2308 simulator from asyncio code, every Keithley2308 method is awaitable
+    """
+    DRIVER_CLASS = Keithley2308
+    ADDRESS_ATTRIBUTE = 'adress'  # Keithley2308 driver stores address as adress
+
+    async def poll(self) -> float:
+        """
+        Trigger and return one reading for battery channel
+        :return: value of reading for battery channel
+        """
+        return await self.call(self.driver.batt_sim_trigger_and_return_reading)
@@ -1,10 +1,9 @@
-import logging
 from enum import Enum
 from datetime import datetime
-import pyvisa
 import time
 
-from PyQt5.QtCore import QMutex, QTimer, QObject
+from PyQt5.QtCore import QTimer, QObject
+from Drivers.VisaConnectionPool import VisaConnectionPool
 
 
 class Keithley2308Commands(Enum):
@@ -95,7 +94,6 @@ class Keithley2308:
     """
     Class for controlling Keithley 2308 Portable Device Battery/Charger Simulator
     """
-    RECONNECT_TIME = 2.0  # Time in [s] to try again to connect to instrument
     MEASUREMENT_RANGE_MIN = 0.0  # Min value of measurement range of current in [A]
     MEASUREMENT_RANGE_MAX = 5.0  # Max value of measurement range of current in [A]
     VOLTAGE_AMPLITUDE_MIN = 0.0  # Min value of voltage amplitude in [V]
@@ -111,8 +109,6 @@ class Keithley2308:
     RELAY_INDEX_MIN = 1  # Min index of output relay array
     RELAY_INDEX_MAX = 4  # Max index of output relay array
 
-    mutex = QMutex()  # Mutex used to prevent Keithley 2308 functions overlaping
-
     def __init__(self, adress='GPIB0::16::INSTR', boudrate=9600, time_out=10):
         """
         init function of Keithley2308 driver
@@ -121,23 +117,8 @@ class Keithley2308:
         :param: time_out: time in [s] before connection timeout
         """
         self.adress = adress
-        self.instrument = None
-
-        rm = pyvisa.ResourceManager()
-        start_time = time.time()
-
-        while self.instrument is None:
-            if time.time() - start_time < time_out:
-                try:
-                    self.instrument = rm.open_resource(self.adress, timeout=10000)
-                except pyvisa.VisaIOError as e:
-                    if rm.last_status == pyvisa.constants.StatusCode.error_resource_busy:
-                        logging.error(f"Failed to connect, instrument is busy, try again in {self.RECONNECT_TIME}s")
-                    else:
-                        raise ConnectionError(f"Can't connect to device")
-                    time.sleep(self.RECONNECT_TIME)
-            else:
-                raise ConnectionError(f"Can't connect to device")
+        self.mutex = VisaConnectionPool.resource_lock(self.adress)  # Lock used to prevent Keithley 2308 functions overlaping
+        self.instrument = VisaConnectionPool.open(self.adress, time_out, timeout=10000)
 
         self.instrument.baud_rate = boudrate
 
@@ -153,13 +134,11 @@ class Keithley2308:
         """
         Measure current in [A] value of battery sim channel
         """
-        self.mutex.lock()
-        command = f"{Keithley2308Commands.BATT_SIM_SELECT_READBACK_FUNCTION.value} '{ReadbackFunctionTypes.READBACK_CURRENT.value}'"
-        self.instrument.write(command)
-        self.wait_for_sim_action()
-        value = float(self.instrument.query(Keithley2308Commands.TRIGGER_AND_RETURN_BATTERY_CHANNEL.value))
-        self.mutex.unlock()
-        return value
+        with self.mutex:
+            command = f"{Keithley2308Commands.BATT_SIM_SELECT_READBACK_FUNCTION.value} '{ReadbackFunctionTypes.READBACK_CURRENT.value}'"
+            self.instrument.write(command)
+            self.wait_for_sim_action()
+            return float(self.instrument.query(Keithley2308Commands.TRIGGER_AND_RETURN_BATTERY_CHANNEL.value))
 
     def triger_continuous_mode_disable(self):
         """
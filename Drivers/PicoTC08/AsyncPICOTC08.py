@@ -0,0 +1,17 @@
+from Drivers.AsyncInstrument import AsyncInstrument
+from Drivers.PicoTC08.PICOTC08 import PicoTC08
+
+
+class AsyncPicoTC08(AsyncInstrument):
+    """
+    Class for controlling Pico TC-08 from asyncio code, every PicoTC08 method is awaitable
+    """
+    DRIVER_CLASS = PicoTC08
+    ADDRESS_ATTRIBUTE = None  # TC-08 is USB library device, not VISA instrument
+
+    async def poll(self) -> [float]:
+        """
+        Read temperature on all channels
+        :return: array of measured temperature of all channels
+        """
+        return await self.call(self.driver.all_temp_read)
@@ -1,8 +1,16 @@
 import ctypes
 from enum import Enum
 
-from picosdk.usbtc08 import usbtc08 as tc08
-from picosdk.functions import assert_pico2000_ok
+from Drivers.TransactionProfiler import TransactionProfiler, ProfiledLibrary
+
+
+def assert_pico2000_ok(status: int):
+    """
+    Raise exception if Pico library call failed, picosdk is imported on first use
+    :param status: value returned by library call
+    """
+    from picosdk.functions import assert_pico2000_ok as assert_ok
+    assert_ok(status)
 
 
 class PicoInputTypes(Enum):
@@ -47,18 +55,21 @@ class PicoTC08:
     CHANNEL_MAX = CHANNEL_EIGHTH  # Max channel range value
 
     def __init__(self):
+        from picosdk.usbtc08 import usbtc08 as tc08  # ctypes library is loaded on connection, not on import
+        profiler = TransactionProfiler.active()
+        self.library = tc08 if profiler is None else ProfiledLibrary(tc08, profiler, 'TC-08')
         self.chandle = ctypes.c_int16()
-        self.status = {"open_unit": tc08.usb_tc08_open_unit()}
+        self.status = {"open_unit": self.library.usb_tc08_open_unit()}
         assert_pico2000_ok(self.status["open_unit"])
         self.chandle = self.status["open_unit"]
 
         # set mains rejection to 50 Hz
-        self.status["set_mains"] = tc08.usb_tc08_set_mains(self.chandle, 0)
+        self.status["set_mains"] = self.library.usb_tc08_set_mains(self.chandle, 0)
         assert_pico2000_ok(self.status["set_mains"])
 
         self.temp = (ctypes.c_float * 9)()
         self.overflow = ctypes.c_int16(0)
-        self.units = tc08.USBTC08_UNITS[TempUnits.UNIT_CELCIUS.value]
+        self.units = self.library.USBTC08_UNITS[TempUnits.UNIT_CELCIUS.value]
 
     def __validate_channel_index(self, channel: int):
         """
@@ -73,7 +84,7 @@ class PicoTC08:
         Set Pico TC-08 temperature unit
         :param unit: temperature unit to be used
         """
-        self.units = tc08.USBTC08_UNITS[unit.value]
+        self.units = self.library.USBTC08_UNITS[unit.value]
 
     def single_temp_read(self, channel: int) -> float:
         """
@@ -83,7 +94,7 @@ class PicoTC08:
         self.__validate_channel_index(channel)
 
         self.channel_enable(channel)
-        self.status["get_single"] = tc08.usb_tc08_get_single(self.chandle, ctypes.byref(self.temp), ctypes.byref(self.overflow), self.units)
+        self.status["get_single"] = self.library.usb_tc08_get_single(self.chandle, ctypes.byref(self.temp), ctypes.byref(self.overflow), self.units)
         assert_pico2000_ok(self.status["get_single"])
         return self.temp[channel]
 
@@ -93,7 +104,7 @@ class PicoTC08:
         :return: array of measured temperature of all channels
         """
         self.all_channel_enable()
-        self.status["get_single"] = tc08.usb_tc08_get_single(self.chandle, ctypes.byref(self.temp), ctypes.byref(self.overflow), self.units)
+        self.status["get_single"] = self.library.usb_tc08_get_single(self.chandle, ctypes.byref(self.temp), ctypes.byref(self.overflow), self.units)
         assert_pico2000_ok(self.status["get_single"])
         temperature = [0] * (self.CHANNEL_MAX + self.CHANNEL_MIN)
         temperature[self.CHANNEL_FIRST] = self.temp[self.CHANNEL_FIRST]
@@ -122,7 +133,7 @@ class PicoTC08:
         self.__validate_channel_index(channel)
 
         type = ctypes.c_int8(input_type.value)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, channel, type)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, channel, type)
         assert_pico2000_ok(self.status["set_channel"])
 
     def channel_disable(self, channel: int):
@@ -133,7 +144,7 @@ class PicoTC08:
         self.__validate_channel_index(channel)
 
         Disable = ctypes.c_int8(PicoInputTypes.OUTPUT_MODE_DISABLED.value)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, channel, Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, channel, Disable)
         assert_pico2000_ok(self.status["set_channel"])
 
     def all_channel_enable(self):
@@ -141,14 +152,14 @@ class PicoTC08:
         Enable all channels of Pico TC-08
         """
         typeK = ctypes.c_int8(PicoInputTypes.OUTPUT_MODE_TYPE_K.value)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIRST, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SECOND, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_THIRD, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FOURTH, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIFTH, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SIXTH, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SEVENTH, typeK)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_EIGHTH, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIRST, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SECOND, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_THIRD, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FOURTH, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIFTH, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SIXTH, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SEVENTH, typeK)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_EIGHTH, typeK)
         assert_pico2000_ok(self.status["set_channel"])
 
     def all_channel_disable(self):
@@ -156,14 +167,14 @@ class PicoTC08:
         Disable all channels of Pico TC-08
         """
         Disable = ctypes.c_int8(PicoInputTypes.OUTPUT_MODE_DISABLED.value)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIRST,  Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SECOND, Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_THIRD,  Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FOURTH, Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIFTH,  Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SIXTH,  Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_SEVENTH, Disable)
-        self.status["set_channel"] = tc08.usb_tc08_set_channel(self.chandle, self.CHANNEL_EIGHTH, Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIRST,  Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SECOND, Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_THIRD,  Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FOURTH, Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_FIFTH,  Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SIXTH,  Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_SEVENTH, Disable)
+        self.status["set_channel"] = self.library.usb_tc08_set_channel(self.chandle, self.CHANNEL_EIGHTH, Disable)
         assert_pico2000_ok(self.status["set_channel"])
 
     def minimum_interval_get(self) -> int:
@@ -171,9 +182,9 @@ class PicoTC08:
         Get minimum interval value in [ms]
         :return: Minimum interval in [ms]
         """
-        self.status["get_minimum_interval_ms"] = tc08.usb_tc08_get_minimum_interval_ms(self.chandle)
+        self.status["get_minimum_interval_ms"] = self.library.usb_tc08_get_minimum_interval_ms(self.chandle)
         return self.status["get_minimum_interval_ms"]
 
     def __del__(self):
-        self.status["close_unit"] = tc08.usb_tc08_close_unit(self.chandle)
+        self.status["close_unit"] = self.library.usb_tc08_close_unit(self.chandle)
         assert_pico2000_ok(self.status["close_unit"])
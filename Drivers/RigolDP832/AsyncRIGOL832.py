@@ -0,0 +1,16 @@
+from Drivers.AsyncInstrument import AsyncInstrument
+from Drivers.RigolDP832.RIGOL832 import RigolDP832, PowerSupplyMeas
+
+
+class AsyncRigolDP832(AsyncInstrument):
+    """
+    Class for controlling Rigol DP832/DP832A power supply from asyncio code, every RigolDP832 method is awaitable
+    """
+    DRIVER_CLASS = RigolDP832
+
+    async def poll(self) -> [PowerSupplyMeas]:
+        """
+        Measure voltage in [V], current in [A], and power in [W] on all channels
+        :return: list of PowerSupplyMeas classes, index 0 holds first channel
+        """
+        return await self.call(self.driver.measure_all_channels)
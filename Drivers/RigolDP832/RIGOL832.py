@@ -1,41 +1,58 @@
-import logging
 from enum import Enum
-from datetime import datetime
-from dataclasses import dataclass, field
-import pyvisa
+from dataclasses import dataclass, replace
+import bisect
+import numpy
+import threading
 import time
 
+from Drivers.VisaConnectionPool import VisaConnectionPool
+from Drivers.RigolDP832.StatusJournal import StatusJournal
+
 
-@dataclass
 class PowerSupplyMeas:
     """
     Class for sending Power Supply measured values
     """
-    _voltage_idx: int = field(default=0, init=False, repr=False, hash=False, compare=False)
-    _current_idx: int = field(default=1, init=False, repr=False, hash=False, compare=False)
-    _power_idx: int = field(default=2, init=False, repr=False, hash=False, compare=False)
-    voltage: float = None
-    current: float = None
-    power: float = None
+    __slots__ = ('voltage', 'current', 'power')
+
+    VOLTAGE_IDX = 0  # Index of voltage in MEAS:ALL? response
+    CURRENT_IDX = 1  # Index of current in MEAS:ALL? response
+    POWER_IDX = 2  # Index of power in MEAS:ALL? response
+    VALUES_QUANTITY = 3  # Number of values in MEAS:ALL? response
 
     def __init__(self, *args, **kwargs):
+        self.voltage = None
+        self.current = None
+        self.power = None
         if len(kwargs) > 0:
             if kwargs.get('data') is not None:
-                data = kwargs.get('data')
-                self.voltage = float(data.split(',')[self._voltage_idx])
-                self.current = float(data.split(',')[self._current_idx])
-                self.power = float(data.split(',')[self._power_idx])
+                self.__parse(kwargs.get('data'))
             else:
                 self.voltage = kwargs.get('voltage')
                 self.current = kwargs.get('current')
                 self.power = kwargs.get('power')
         else:
-            if isinstance(args[0], str):
-                elements = args[0].split(',')
-                if len(elements) == (self._power_idx + 1):
-                    self.voltage = float(elements[self._voltage_idx])
-                    self.current = float(elements[self._current_idx])
-                    self.power = float(elements[self._power_idx])
+            if isinstance(args[0], (str, bytes)):
+                self.__parse(args[0])
+
+    def __parse(self, data):
+        """
+        Parse MEAS:ALL? response, data is split only once
+        :param data: response as str or raw bytes
+        """
+        elements = data.split(',' if isinstance(data, str) else b',')
+        if len(elements) == self.VALUES_QUANTITY:
+            self.voltage = float(elements[self.VOLTAGE_IDX])
+            self.current = float(elements[self.CURRENT_IDX])
+            self.power = float(elements[self.POWER_IDX])
+
+    def __repr__(self):
+        return f"PowerSupplyMeas(voltage={self.voltage}, current={self.current}, power={self.power})"
+
+    def __eq__(self, other):
+        if not isinstance(other, PowerSupplyMeas):
+            return NotImplemented
+        return (self.voltage, self.current, self.power) == (other.voltage, other.current, other.power)
 
 
 class RigolDP832Commands(Enum):
@@ -43,6 +60,8 @@ class RigolDP832Commands(Enum):
     Enum class with commends in string format
     """
     SELECT_CHANNEL = 'INST:SELE CH'
+    SOURCE = 'SOUR'
+    APPLY = 'APPL CH'
     SET_OUTPUT_CURRENT = ':CURR'
     SET_OUTPUT_VOLTAGE = ':VOLT'
     GET_OUTPUT_VALUES = 'APPL? CH'
@@ -54,12 +73,33 @@ class RigolDP832Commands(Enum):
     SET_OCP = 'OUTP:OCP CH'
     SET_OVP_LIMIT = 'OUTP:OVP:VAL CH'
     SET_OCP_LIMIT = 'OUTP:OCP:VAL CH'
+    CLEAR_OVP = 'OUTP:OVP:CLEAR CH'
+    CLEAR_OCP = 'OUTP:OCP:CLEAR CH'
     READ_CHANNEL_STATE = 'OUTP? CH'
     READ_OVP_STATE = 'OUTP:OVP? CH'
     READ_OCP_STATE = 'OUTP:OCP? CH'
     GET_OVP_VALUE = 'OUTP:OVP:VAL? CH'
     GET_OCP_VALUE = 'OUTP:OCP:VAL? CH'
     READ_OUTPUT_MODE = ':OUTP:MODE? CH'
+    READ_CHANNEL_QUESTIONABLE_CONDITION = 'STAT:QUES:INST:ISUM'
+    OPERATION_COMPLETE = '*OPC'
+    OPERATION_COMPLETE_QUERY = '*OPC?'
+    WAIT_TO_CONTINUE = '*WAI'
+    READ_EVENT_STATUS_REGISTER = '*ESR?'
+    TIMER_PARAMETER = 'TIME:PARA'
+    TIMER_GROUPS = 'TIME:GROUP'
+    TIMER_CYCLES = 'TIME:CYCLE'
+    TIMER_END_STATE = 'TIME:ENDS'
+    TIMER_STATE = 'TIME'
+    READ_TIMER_STATE = 'TIME?'
+    RECORDER_PERIOD = 'REC:PERI'
+    READ_RECORDER_PERIOD = 'REC:PERI?'
+    RECORDER_MEMORY = 'REC:MEM'
+    RECORDER_STATE = 'REC'
+    ANALYZER_MEMORY = 'ANAL:MEM'
+    READ_ANALYZER_START_TIME = 'ANAL:STARTT?'
+    READ_ANALYZER_END_TIME = 'ANAL:ENDT?'
+    READ_ANALYZER_VALUE = 'ANAL:VAL?'
 
 
 class RigolDP832OutputProtectionStates(Enum):
@@ -89,11 +129,279 @@ class RigolDP832OutputModes(Enum):
     UNREGULATED = 'UR'
 
 
+class RigolDP832SyncModes(Enum):
+    """
+    Enum class with methods of confirming command completion
+    """
+    OPC_QUERY = 'OPC_QUERY'  # Block on *OPC? until all pending commands are finished
+    WAIT = 'WAIT'  # Append *WAI so next command is held until pending commands are finished
+    STATUS_BYTE = 'STATUS_BYTE'  # Append *OPC and poll Operation Complete bit of event status register
+
+
+@dataclass
+class CommandTimingStats:
+    """
+    Class for storing execution time statistics of single command type
+    """
+    count: int = 0
+    total_time: float = 0.0  # Time in [s]
+    min_time: float = None  # Time in [s]
+    max_time: float = None  # Time in [s]
+
+    @property
+    def mean_time(self) -> float:
+        """
+        Mean execution time in [s] of command
+        """
+        if self.count == 0:
+            return 0.0
+        return self.total_time / self.count
+
+    def register(self, elapsed_time: float):
+        """
+        Add single command execution time to statistics
+        :param elapsed_time: command execution time in [s]
+        """
+        self.count += 1
+        self.total_time += elapsed_time
+        if self.min_time is None or elapsed_time < self.min_time:
+            self.min_time = elapsed_time
+        if self.max_time is None or elapsed_time > self.max_time:
+            self.max_time = elapsed_time
+
+
+class RigolDP832TimerEndStates(Enum):
+    """
+    Enum class with output states after finished timer sequence
+    """
+    OFF = 'OFF'  # Output is turned off
+    LAST = 'LAST'  # Output stays at values of last step
+
+
+@dataclass(frozen=True)
+class SweepStep:
+    """
+    Class for storing single step of timer sequence
+    """
+    voltage: float  # Voltage in [V]
+    current: float  # Current in [A]
+    dwell: float  # Time in [s] of step
+
+
+@dataclass
+class SweepProgress:
+    """
+    Class for sending progress of running timer sequence
+    """
+    running: bool
+    step: int = None  # Index of step being executed, None if not known
+    cycle: int = None  # Index of cycle being executed, None if not known
+    elapsed: float = None  # Time in [s] since sequence start
+
+
+class RigolDP832StateFields(Enum):
+    """
+    Enum class with names of channel settings held in state cache
+    """
+    VOLTAGE_SET = 'voltage_set'
+    CURRENT_SET = 'current_set'
+    OVP_VALUE = 'ovp_value'
+    OCP_VALUE = 'ocp_value'
+    OUTPUT_STATE = 'output_state'
+    OVP_STATE = 'ovp_state'
+    OCP_STATE = 'ocp_state'
+
+
+@dataclass(frozen=True)
+class RigolDP832ChannelState:
+    """
+    Class for storing settings of single power supply channel, None means value is not known
+    """
+    voltage_set: float = None  # Set voltage in [V]
+    current_set: float = None  # Set current in [A]
+    ovp_value: float = None  # OVP limit in [V]
+    ocp_value: float = None  # OCP limit in [A]
+    output_state: RigolDP832OutputStates = None
+    ovp_state: RigolDP832OutputProtectionStates = None
+    ocp_state: RigolDP832OutputProtectionStates = None
+
+
+@dataclass(frozen=True)
+class RigolDP832Snapshot:
+    """
+    Class for sending state of whole power supply read at once
+    """
+    timestamp: float  # Time in [s] from time.monotonic()
+    channels: tuple  # RigolDP832ChannelState of every channel, index 0 holds first channel
+    modes: tuple  # RigolDP832OutputModes of every channel, index 0 holds first channel
+
+    def channel(self, channel: int) -> RigolDP832ChannelState:
+        """
+        Return settings of channel
+        :param channel: specific channel to interact with
+        :return: channel settings
+        """
+        return self.channels[channel - 1]
+
+
+@dataclass(frozen=True)
+class RigolDP832ChannelStatus:
+    """
+    Class for storing regulation mode and protection trips of single channel decoded from questionable status register
+    """
+    mode: RigolDP832OutputModes
+    ovp_tripped: bool
+    ocp_tripped: bool
+
+
+class RigolDP832StateCache:
+    """
+    Class for holding shadow copy of power supply settings, so they can be read without bus access
+    """
+    def __init__(self, channels: range):
+        """
+        Class initialization
+        :param channels: range of channel indexes to hold settings of
+        """
+        self.channels = {channel: RigolDP832ChannelState() for channel in channels}
+        self.hits = 0  # Number of reads served from cache
+        self.misses = 0  # Number of reads that needed instrument query
+
+    def get(self, channel: int, field: RigolDP832StateFields):
+        """
+        Read setting from cache and count hit or miss
+        :param channel: specific channel to interact with
+        :param field: setting to be read
+        :return: cached value or None if value is not known
+        """
+        value = getattr(self.channels[channel], field.value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def update(self, channel: int, field: RigolDP832StateFields, value):
+        """
+        Store setting in cache
+        :param channel: specific channel to interact with
+        :param field: setting to be stored
+        :param value: new value of setting
+        """
+        self.channels[channel] = replace(self.channels[channel], **{field.value: value})
+
+    def invalidate(self, channel: int = None):
+        """
+        Forget cached settings, next reads will query instrument
+        :param channel: specific channel to interact with, all channels if None
+        """
+        channels = list(self.channels.keys()) if channel is None else [channel]
+        for index in channels:
+            self.channels[index] = RigolDP832ChannelState()
+
+    def channel_state_get(self, channel: int) -> RigolDP832ChannelState:
+        """
+        Return all cached settings of channel
+        :param channel: specific channel to interact with
+        :return: cached channel settings
+        """
+        return self.channels[channel]
+
+    def channel_state_set(self, channel: int, state: RigolDP832ChannelState):
+        """
+        Replace all cached settings of channel
+        :param channel: specific channel to interact with
+        :param state: new channel settings
+        """
+        self.channels[channel] = state
+
+    def stats_reset(self):
+        """
+        Clear hit and miss counters
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+class RigolDP832WriteQueue:
+    """
+    Class for coalescing pending setting writes, only last value written for each (channel, setting) pair is kept
+    """
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.coalesced = 0  # Number of writes replaced by newer value before being sent
+
+    def put(self, channel: int, field: RigolDP832StateFields, value):
+        """
+        Queue setting write, replaces pending write of the same setting
+        :param channel: specific channel to interact with
+        :param field: setting to be written
+        :param value: new value of setting
+        """
+        with self.lock:
+            if self.pending.pop((channel, field), None) is not None:
+                self.coalesced += 1
+            self.pending[(channel, field)] = value  # re-inserted at the end, so writes keep order of last change
+
+    def get(self, channel: int, field: RigolDP832StateFields, default=None):
+        """
+        Return value of pending write
+        :param channel: specific channel to interact with
+        :param field: setting to be read
+        :param default: value returned if setting has no pending write
+        :return: value waiting to be written, default if there is none
+        """
+        with self.lock:
+            return self.pending.get((channel, field), default)
+
+    def fields(self) -> [(int, RigolDP832StateFields)]:
+        """
+        Return settings with pending writes
+        :return: list of (channel, setting) pairs
+        """
+        with self.lock:
+            return list(self.pending.keys())
+
+    def peek(self) -> dict:
+        """
+        Return copy of all pending writes, they stay readable with get() until they are removed
+        :return: dictionary of {(channel, setting): value} in order of last change
+        """
+        with self.lock:
+            return dict(self.pending)
+
+    def remove(self, settings: dict):
+        """
+        Remove written settings, setting changed again in the meantime stays pending
+        :param settings: dictionary of {(channel, setting): value} returned by peek()
+        """
+        with self.lock:
+            for key, value in settings.items():
+                if key in self.pending and self.pending[key] == value:
+                    del self.pending[key]
+
+    def take(self) -> dict:
+        """
+        Remove and return all pending writes
+        :return: dictionary of {(channel, setting): value} in order of last change
+        """
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+        return pending
+
+    def __len__(self):
+        return len(self.pending)
+
+
 class RigolDP832:
     """
     Class for controlling Rigol DP832/DP832A power supply
     """
-    RECONNECT_TIME = 2.0  # Time in [S] to try again to connect to instrument
     CHANNEL_FIRST = 1  # First channel of Rigol DP832/DP832A
     CHANNEL_SECOND = 2  # Second channel of Rigol DP832/DP832A
     CHANNEL_THIRD = 3  # Third channel of Rigol DP832/DP832A
@@ -104,35 +412,81 @@ class RigolDP832:
     OUTPUT_VOLTAGE_MIN = 0.0  # Min voltage in [V] to be set on channel
     OUTPUT_CURRENT_MAX = 3.0  # Max current in [A] to be set on channel
     OUTPUT_CURRENT_MIN = 0.0  # Min current in [A] to be set on channel
+    MEASURE_ALL_CHANNELS_COMMAND = ';:'.join(f"{RigolDP832Commands.MEASURE_ALL.value}{channel}"
+                                             for channel in range(CHANNEL_MIN, CHANNEL_MAX + 1))
+    OPERATION_COMPLETE_BIT = 0x01  # Operation Complete bit of standard event status register
+    QUESTIONABLE_VOLTAGE_BIT = 0x01  # Voltage unregulated bit of channel questionable status register, set in CC mode
+    QUESTIONABLE_CURRENT_BIT = 0x02  # Current unregulated bit of channel questionable status register, set in CV mode
+    QUESTIONABLE_OVP_BIT = 0x04  # Overvoltage bit of channel questionable status register
+    QUESTIONABLE_OCP_BIT = 0x08  # Overcurrent bit of channel questionable status register
+    OPERATION_COMPLETE_POLL_TIME = 0.002  # Time in [s] between event status register reads
+    OPERATION_COMPLETE_TIMEOUT = 5.0  # Time in [s] to wait for command completion
+    TIMER_GROUPS_MAX = 2048  # Max number of steps of timer sequence
+    TIMER_DWELL_MIN = 1.0  # Min time in [s] of timer step
+    TIMER_DWELL_MAX = 99999.0  # Max time in [s] of timer step
+    TIMER_CYCLES_MAX = 99999  # Max number of timer cycles
+    TIMER_UPLOAD_CHUNK = 32  # Number of timer steps written in single compound command
+    SNAPSHOT_COMMANDS = (  # Queries sent for every channel by snapshot, order matches parsing
+        RigolDP832Commands.GET_OUTPUT_VALUES,
+        RigolDP832Commands.GET_OVP_VALUE,
+        RigolDP832Commands.GET_OCP_VALUE,
+        RigolDP832Commands.READ_CHANNEL_STATE,
+        RigolDP832Commands.READ_OVP_STATE,
+        RigolDP832Commands.READ_OCP_STATE,
+        RigolDP832Commands.READ_OUTPUT_MODE,
+    )
+    RECORDER_PERIOD_MIN = 1  # Min record period in [s]
+    RECORDER_PERIOD_MAX = 99999  # Max record period in [s]
+    RECORDER_LOCATION_MIN = 1  # First record file location in internal memory
+    RECORDER_LOCATION_MAX = 10  # Last record file location in internal memory
+    RECORDER_DOWNLOAD_CHUNK = 64  # Number of recorded points read in single compound query
+    COMMAND_SETTLE_TIME_DEFAULT = 0.0  # Time in [s] to wait after completion of commands missing in table
+    COMMAND_SETTLE_TIME = {  # Time in [s] to wait after command completion for output to settle
+        RigolDP832Commands.SET_OUTPUT_VOLTAGE: 0.01,
+        RigolDP832Commands.SET_OUTPUT_CURRENT: 0.01,
+        RigolDP832Commands.APPLY: 0.01,
+        RigolDP832Commands.TURN_ON_OFF_CHANNEL: 0.05,
+        RigolDP832Commands.SET_OVP: 0.0,
+        RigolDP832Commands.SET_OCP: 0.0,
+        RigolDP832Commands.SET_OVP_LIMIT: 0.0,
+        RigolDP832Commands.SET_OCP_LIMIT: 0.0,
+        RigolDP832Commands.CLEAR_OVP: 0.0,
+        RigolDP832Commands.CLEAR_OCP: 0.0,
+    }
 
-    def __init__(self, address='USB0::0x1AB1::0x0E11::DP8C193604338::INSTR', boudrate=9600, time_out=10):
+    def __init__(self, address='USB0::0x1AB1::0x0E11::DP8C193604338::INSTR', boudrate=9600, time_out=10,
+                 sync_mode: RigolDP832SyncModes = RigolDP832SyncModes.OPC_QUERY):
         """
         init function of RigolDP832 driver
         :param address: Address of Rigol power supply to connect with
         :param boudrate: communication channel boudrate
         :param: time_out: time in [s] before connection timeout
+        :param sync_mode: method used to confirm command completion
         """
         self.address = address
-        self.instrument = None
-
-        rm = pyvisa.ResourceManager()
-        start_time = time.time()
-        while self.instrument is None:
-            if time.time() - start_time < time_out:
-                try:
-                    self.instrument = rm.open_resource(self.address)
-                except pyvisa.VisaIOError as e:
-                    if rm.last_status == pyvisa.constants.StatusCode.error_resource_busy:
-                        logging.error(f"Failed to connect, instrument is busy, try again in {self.RECONNECT_TIME}s")
-                    else:
-                        raise ConnectionError(f"Can't connect to device")
-                    time.sleep(self.RECONNECT_TIME)
-            else:
-                raise ConnectionError(f"Can't connect to device")
+        self.sync_mode = sync_mode
+        self.settle_times = dict(self.COMMAND_SETTLE_TIME)
+        self.command_stats = {}
+        self.cache = RigolDP832StateCache(range(self.CHANNEL_MIN, self.CHANNEL_MAX + 1))
+        self.write_queue = RigolDP832WriteQueue()
+        self.measure_status_commands = {}  # Compound measurement queries, {tuple of channels: command}
+        self.session_state = VisaConnectionPool.session_state(address)  # Shared by all drivers using the session
+        self.sweeps = {}  # Uploaded timer sequences, {channel: (steps, cycles)}
+        self.sweeps_start_time = {}  # Time from time.monotonic() of timer sequences start, {channel: time}
+
+        self.instrument = VisaConnectionPool.open(self.address, time_out)
 
         self.instrument.baud_rate = boudrate
 
-        self.status_channel_register = []
+        self.status_journal = StatusJournal()
+
+    def close(self):
+        """
+        Write status journal records collected for spill file and close pooled session with power supply,
+        other drivers with the same address share the session and must not be used afterwards
+        """
+        self.status_journal.flush()
+        VisaConnectionPool.close(self.address)
 
     def __validate_channel_index(self, channel: int):
         """
@@ -144,22 +498,234 @@ class RigolDP832:
 
     def register_status(self, channel: int):
         """
-        Register status of channel in list as string
+        Register status of channel in status journal, cached status is used if it is known
         :param channel: specific channel to interact with
         """
         self.__validate_channel_index(channel)
-        now = datetime.now()
-        current_time = now.strftime("%H:%M:%S")
-        status = f"[{current_time}] Channel {channel} status: {self.channel_state_read(channel)}"
-        self.status_channel_register.append(status)
+        self.status_journal.append(channel, self.channel_state_read(channel))
+
+    def cache_reconcile(self, channel: int = None):
+        """
+        Refresh state cache with settings read from instrument, catches changes made on front panel.
+        Settings with pending writes keep their cached values
+        :param channel: specific channel to interact with, all channels if None
+        """
+        self.selected_channel = None  # selection could be changed on front panel as well
+        channels = range(self.CHANNEL_MIN, self.CHANNEL_MAX + 1) if channel is None else [channel]
+        previous = {index: self.cache.channel_state_get(index) for index in channels}
+        self.__channels_state_read(channels)
+        for index, field in self.write_queue.fields():  # settings waiting in write queue are not overwritten
+            if index in previous:
+                self.cache.update(index, field, getattr(previous[index], field.value))
+
+    def snapshot(self) -> RigolDP832Snapshot:
+        """
+        Read settings, states and modes of all channels in single compound query, state cache is refreshed as well
+        :return: immutable state of power supply
+        """
+        self.selected_channel = None
+        states, modes = self.__channels_state_read(range(self.CHANNEL_MIN, self.CHANNEL_MAX + 1))
+        return RigolDP832Snapshot(time.monotonic(), tuple(states), tuple(modes))
+
+    @staticmethod
+    def __parse_state(output: str, states):
+        """
+        Convert state query response to enum value
+        :param output: stripped query response
+        :param states: enum class of state
+        :return: matching state or UNKNOWN
+        """
+        if output == states.ON.value:
+            return states.ON
+        elif output == states.OFF.value:
+            return states.OFF
+        return states.UNKNOWN
 
     @staticmethod
-    def wait_for_ps_action():
+    def __parse_mode(output: str) -> RigolDP832OutputModes:
         """
-        There is need to wait after cmd write for power supply action
+        Convert output mode query response to enum value
+        :param output: stripped query response
+        :return: matching output mode
         """
-        cmd_wait_time = 1  # in seconds
-        time.sleep(cmd_wait_time)
+        if output == RigolDP832OutputModes.CONSTANT_CURRENT.value:
+            return RigolDP832OutputModes.CONSTANT_CURRENT
+        elif output == RigolDP832OutputModes.CONSTANT_VOLTAGE.value:
+            return RigolDP832OutputModes.CONSTANT_VOLTAGE
+        return RigolDP832OutputModes.UNREGULATED
+
+    def __channels_state_read(self, channels) -> ([RigolDP832ChannelState], [RigolDP832OutputModes]):
+        """
+        Read settings, states and modes of channels in single compound query and store them in cache
+        :param channels: channels to interact with
+        :return: list of channel settings and list of channel modes, in order of channels
+        """
+        for channel in channels:
+            self.__validate_channel_index(channel)
+        command = ';:'.join(f"{command.value.lstrip(':')}{channel}"
+                            for channel in channels for command in self.SNAPSHOT_COMMANDS)
+        values = iter(self.instrument.query(command).strip().split(';'))
+        states = []
+        modes = []
+        for channel in channels:
+            output_values = next(values).split(',')
+            state = RigolDP832ChannelState(voltage_set=float(output_values[1]),
+                                           current_set=float(output_values[2]),
+                                           ovp_value=float(next(values)),
+                                           ocp_value=float(next(values)),
+                                           output_state=self.__parse_state(next(values), RigolDP832OutputStates),
+                                           ovp_state=self.__parse_state(next(values), RigolDP832OutputProtectionStates),
+                                           ocp_state=self.__parse_state(next(values), RigolDP832OutputProtectionStates))
+            self.cache.channel_state_set(channel, state)
+            states.append(state)
+            modes.append(self.__parse_mode(next(values)))
+        return states, modes
+
+    def settle_time_set(self, command: RigolDP832Commands, settle_time: float):
+        """
+        Set time to wait after completion of command
+        :param command: command to interact with
+        :param settle_time: time in [s] to wait after command completion
+        """
+        if settle_time < 0:
+            raise ValueError("Error: Settle time can't be negative")
+        self.settle_times[command] = settle_time
+
+    def command_stats_reset(self):
+        """
+        Clear execution time statistics of all commands
+        """
+        self.command_stats = {}
+
+    def wait_for_ps_action(self, command: RigolDP832Commands = None):
+        """
+        Wait until power supply finished executing written commands and let output settle
+        :param command: last written command, used to look up settle time
+        """
+        if self.sync_mode == RigolDP832SyncModes.OPC_QUERY:
+            self.instrument.query(RigolDP832Commands.OPERATION_COMPLETE_QUERY.value)  # returns when commands are completed
+        elif self.sync_mode == RigolDP832SyncModes.STATUS_BYTE:
+            start_time = time.perf_counter()
+            while not int(self.instrument.query(RigolDP832Commands.READ_EVENT_STATUS_REGISTER.value)) & self.OPERATION_COMPLETE_BIT:
+                if time.perf_counter() - start_time > self.OPERATION_COMPLETE_TIMEOUT:
+                    raise TimeoutError("Error: Power supply didn't complete command in time")
+                time.sleep(self.OPERATION_COMPLETE_POLL_TIME)
+
+        settle_time = self.settle_times.get(command, self.COMMAND_SETTLE_TIME_DEFAULT)
+        if settle_time > 0:
+            time.sleep(settle_time)
+
+    def send_command(self, command: RigolDP832Commands, message: str):
+        """
+        Write command to power supply, wait for its completion and register execution time
+        :param command: command type, used to look up settle time and to group timing statistics
+        :param message: full command message to be written
+        """
+        if self.sync_mode == RigolDP832SyncModes.WAIT:
+            message = f"{message};{RigolDP832Commands.WAIT_TO_CONTINUE.value}"
+        elif self.sync_mode == RigolDP832SyncModes.STATUS_BYTE:
+            message = f"{message};{RigolDP832Commands.OPERATION_COMPLETE.value}"
+
+        start_time = time.perf_counter()
+        self.instrument.write(message)  # send command to Rigol power supply
+        self.wait_for_ps_action(command)  # wait for Rigol power supply to execute command
+        self.command_stats.setdefault(command, CommandTimingStats()).register(time.perf_counter() - start_time)
+
+    @staticmethod
+    def __setting_message(channel: int, field: RigolDP832StateFields, value) -> (RigolDP832Commands, str):
+        """
+        Build command message that writes single setting
+        :param channel: specific channel to interact with
+        :param field: setting to be written
+        :param value: new value of setting
+        :return: command type and command message
+        """
+        if field == RigolDP832StateFields.VOLTAGE_SET:
+            return (RigolDP832Commands.SET_OUTPUT_VOLTAGE,
+                    f"{RigolDP832Commands.SOURCE.value}{channel}{RigolDP832Commands.SET_OUTPUT_VOLTAGE.value} {value}")
+        elif field == RigolDP832StateFields.CURRENT_SET:
+            return (RigolDP832Commands.SET_OUTPUT_CURRENT,
+                    f"{RigolDP832Commands.SOURCE.value}{channel}{RigolDP832Commands.SET_OUTPUT_CURRENT.value} {value}")
+        elif field == RigolDP832StateFields.OVP_VALUE:
+            return RigolDP832Commands.SET_OVP_LIMIT, f"{RigolDP832Commands.SET_OVP_LIMIT.value}{channel},{value}"
+        elif field == RigolDP832StateFields.OCP_VALUE:
+            return RigolDP832Commands.SET_OCP_LIMIT, f"{RigolDP832Commands.SET_OCP_LIMIT.value}{channel},{value}"
+        elif field == RigolDP832StateFields.OUTPUT_STATE:
+            return RigolDP832Commands.TURN_ON_OFF_CHANNEL, f"{RigolDP832Commands.TURN_ON_OFF_CHANNEL.value}{channel},{value.value}"
+        elif field == RigolDP832StateFields.OVP_STATE:
+            return RigolDP832Commands.SET_OVP, f"{RigolDP832Commands.SET_OVP.value}{channel},{value.value}"
+        elif field == RigolDP832StateFields.OCP_STATE:
+            return RigolDP832Commands.SET_OCP, f"{RigolDP832Commands.SET_OCP.value}{channel},{value.value}"
+        raise ValueError(f"Error: Setting {field} can't be written")
+
+    def settings_write(self, settings: dict):
+        """
+        Write many settings as single compound command and wait once for their completion
+        :param settings: dictionary of {(channel, setting): value}, settings are written in dictionary order
+        """
+        if len(settings) == 0:
+            return
+        commands = []
+        messages = []
+        for (channel, field), value in settings.items():
+            self.__validate_channel_index(channel)
+            command, message = self.__setting_message(channel, field, value)
+            commands.append(command)
+            messages.append(message)
+
+        # batch waits for, and is accounted to, the command with the longest settle time
+        slowest = max(commands, key=lambda item: self.settle_times.get(item, self.COMMAND_SETTLE_TIME_DEFAULT))
+        self.send_command(slowest, ';:'.join(messages))
+        for (channel, field), value in settings.items():
+            self.cache.update(channel, field, value)
+
+    def write_queue_flush(self):
+        """
+        Write all settings pending in write queue as single batch, settings stay pending until cache is updated
+        """
+        settings = self.write_queue.peek()
+        try:
+            self.settings_write(settings)
+        finally:
+            self.write_queue.remove(settings)  # failed batch is dropped, so invalid setting isn't retried forever
+
+    @property
+    def selected_channel(self):
+        """
+        Channel selected with INST:SELE, stored per pooled session, so selection made by other driver instance
+        with the same address is seen as well
+        :return: selected channel, None if not known
+        """
+        return self.session_state.get('selected_channel')
+
+    @selected_channel.setter
+    def selected_channel(self, channel: int):
+        self.session_state['selected_channel'] = channel
+
+    def channel_select(self, channel: int):
+        """
+        Select channel for commands without channel parameter, write is skipped if channel is already selected
+        :param channel: specific channel to interact with
+        """
+        self.__validate_channel_index(channel)
+        if self.selected_channel != channel:
+            command = f"{RigolDP832Commands.SELECT_CHANNEL.value}{channel}"
+            self.instrument.write(command)
+            self.selected_channel = channel
+
+    def output_apply(self, channel: int, output_voltage: float, output_current: float):
+        """
+        Set power supply output voltage and current on channel with single command
+        :param channel: specific channel to interact with
+        :param output_voltage: new output voltage in [V] to be set on channel
+        :param output_current: new output current in [A] to be set on channel
+        """
+        self.__validate_channel_index(channel)
+        command = f"{RigolDP832Commands.APPLY.value}{channel},{output_voltage},{output_current}"  # command to change voltage and current in specific channel
+        self.send_command(RigolDP832Commands.APPLY, command)
+        self.selected_channel = channel  # APPL selects channel as well
+        self.cache.update(channel, RigolDP832StateFields.VOLTAGE_SET, output_voltage)
+        self.cache.update(channel, RigolDP832StateFields.CURRENT_SET, output_current)
 
     def output_voltage_set(self, channel: int, output_voltage: float):
         """
@@ -175,11 +741,9 @@ class RigolDP832:
             if self.OUTPUT_VOLTAGE_MAX < output_voltage < self.OUTPUT_VOLTAGE_MIN:
                 raise ValueError("Error: Wrong output Voltage value was given")
 
-        command = f"{RigolDP832Commands.SELECT_CHANNEL.value}{channel}"
-        self.instrument.write(command)
-        command = f"{RigolDP832Commands.SET_OUTPUT_VOLTAGE.value} {output_voltage}"  # command to change voltage in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        command = f"{RigolDP832Commands.SOURCE.value}{channel}{RigolDP832Commands.SET_OUTPUT_VOLTAGE.value} {output_voltage}"  # command to change voltage in specific channel
+        self.send_command(RigolDP832Commands.SET_OUTPUT_VOLTAGE, command)
+        self.cache.update(channel, RigolDP832StateFields.VOLTAGE_SET, output_voltage)
 
     def output_voltage_measure(self, channel: int) -> float:
         """
@@ -190,7 +754,6 @@ class RigolDP832:
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.MEASURE_VOLTAGE.value}{channel}"  # command to get voltage in specific channel
         voltage = float(self.instrument.query(command))  # query instrument with command to get voltage
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
         return voltage
 
     def output_current_set(self, channel: int, output_current: float):
@@ -202,11 +765,9 @@ class RigolDP832:
         self.__validate_channel_index(channel)
         if self.OUTPUT_CURRENT_MAX < output_current < self.OUTPUT_CURRENT_MIN:
             raise ValueError("Error: Wrong Current value was given")
-        command = f"{RigolDP832Commands.SELECT_CHANNEL.value}{channel}"
-        self.instrument.write(command)
-        command = f"{RigolDP832Commands.SET_OUTPUT_CURRENT.value} {output_current}"  # command to change current in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        command = f"{RigolDP832Commands.SOURCE.value}{channel}{RigolDP832Commands.SET_OUTPUT_CURRENT.value} {output_current}"  # command to change current in specific channel
+        self.send_command(RigolDP832Commands.SET_OUTPUT_CURRENT, command)
+        self.cache.update(channel, RigolDP832StateFields.CURRENT_SET, output_current)
 
     def output_current_measure(self, channel: int) -> float:
         """
@@ -217,29 +778,51 @@ class RigolDP832:
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.MEASURE_CURRENT.value}{channel}"  # command to get current in specific channel
         current = float(self.instrument.query(command))  # query instrument with command to get current
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
         return current
 
-    def output_voltage_value_get(self, channel: int) -> float:
+    def output_values_get(self, channel: int) -> (float, float):
+        """
+        Get power supply output voltage and current of channel from instrument and store them in cache
+        :param channel: specific channel to interact with
+        :return: returns voltage value in [V] and current value in [A] of specific channel
+        """
+        self.__validate_channel_index(channel)
+        command = f"{RigolDP832Commands.GET_OUTPUT_VALUES.value}{channel}"
+        values = self.instrument.query(command).split(',')
+        voltage = float(values[1])
+        current = float(values[2])
+        self.cache.update(channel, RigolDP832StateFields.VOLTAGE_SET, voltage)
+        self.cache.update(channel, RigolDP832StateFields.CURRENT_SET, current)
+        return voltage, current
+
+    def output_voltage_value_get(self, channel: int, use_cache: bool = True) -> float:
         """
         Get power supply output voltage of channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached value if it is known
         :return: returns voltage value in [V] of specific channel
         """
         self.__validate_channel_index(channel)
-        command = f"{RigolDP832Commands.GET_OUTPUT_VALUES.value}{channel}"
-        voltage = float(self.instrument.query(command).split(',')[1])
+        if use_cache:
+            voltage = self.cache.get(channel, RigolDP832StateFields.VOLTAGE_SET)
+            if voltage is not None:
+                return voltage
+        voltage, _ = self.output_values_get(channel)
         return voltage
 
-    def output_current_value_get(self, channel: int) -> float:
+    def output_current_value_get(self, channel: int, use_cache: bool = True) -> float:
         """
         Get power supply output current of channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached value if it is known
         :return: returns current value in [A] of specific channel
         """
         self.__validate_channel_index(channel)
-        command = f"{RigolDP832Commands.GET_OUTPUT_VALUES.value}{channel}"
-        current = float(self.instrument.query(command).split(',')[2])
+        if use_cache:
+            current = self.cache.get(channel, RigolDP832StateFields.CURRENT_SET)
+            if current is not None:
+                return current
+        _, current = self.output_values_get(channel)
         return current
 
     def measure_all_values(self, channel: int) -> PowerSupplyMeas:
@@ -253,6 +836,96 @@ class RigolDP832:
         output = self.instrument.query(command)
         return PowerSupplyMeas(output)
 
+    def measure_all_channels(self) -> [PowerSupplyMeas]:
+        """
+        Measure voltage in [V], current in [A], and power in [W] on all channels in single bus transaction
+        :return: list of PowerSupplyMeas classes, index 0 holds first channel
+        """
+        self.instrument.write(self.MEASURE_ALL_CHANNELS_COMMAND)
+        output = self.instrument.read_raw()
+        return [PowerSupplyMeas(values) for values in output.strip().split(b';')]
+
+    def measure_channels(self, channels: [int]) -> [PowerSupplyMeas]:
+        """
+        Measure voltage in [V], current in [A], and power in [W] on selected channels in single bus transaction
+        :param channels: channels to interact with
+        :return: list of PowerSupplyMeas classes in order of channels
+        """
+        if len(channels) == 0:
+            return []
+        for channel in channels:
+            self.__validate_channel_index(channel)
+        self.instrument.write(';:'.join(f"{RigolDP832Commands.MEASURE_ALL.value}{channel}" for channel in channels))
+        output = self.instrument.read_raw()
+        return [PowerSupplyMeas(values) for values in output.strip().split(b';')]
+
+    @classmethod
+    def channel_status_parse(cls, condition: int) -> RigolDP832ChannelStatus:
+        """
+        Decode condition of channel questionable status register
+        :param condition: value of condition register
+        :return: regulation mode and protection trips of channel
+        """
+        regulation = condition & (cls.QUESTIONABLE_VOLTAGE_BIT | cls.QUESTIONABLE_CURRENT_BIT)
+        if regulation == cls.QUESTIONABLE_VOLTAGE_BIT:
+            mode = RigolDP832OutputModes.CONSTANT_CURRENT
+        elif regulation == cls.QUESTIONABLE_CURRENT_BIT:
+            mode = RigolDP832OutputModes.CONSTANT_VOLTAGE
+        else:
+            mode = RigolDP832OutputModes.UNREGULATED  # both bits set, or none when output is off
+        return RigolDP832ChannelStatus(mode, bool(condition & cls.QUESTIONABLE_OVP_BIT),
+                                       bool(condition & cls.QUESTIONABLE_OCP_BIT))
+
+    def measure_channels_status(self, channels: [int]) -> ([PowerSupplyMeas], [RigolDP832ChannelStatus]):
+        """
+        Measure voltage in [V], current in [A], and power in [W] and read mode and protection trips of selected
+        channels in single bus transaction
+        :param channels: channels to interact with
+        :return: list of PowerSupplyMeas classes and list of RigolDP832ChannelStatus classes, in order of channels
+        """
+        if len(channels) == 0:
+            return [], []
+        for channel in channels:
+            self.__validate_channel_index(channel)
+        self.instrument.write(';:'.join(f"{RigolDP832Commands.MEASURE_ALL.value}{channel};:"
+                                        f"{RigolDP832Commands.READ_CHANNEL_QUESTIONABLE_CONDITION.value}{channel}:COND?"
+                                        for channel in channels))
+        values = self.instrument.read_raw().strip().split(b';')
+        measurements = [PowerSupplyMeas(output) for output in values[0::2]]
+        statuses = [self.channel_status_parse(int(output)) for output in values[1::2]]
+        return measurements, statuses
+
+    def measure_channels_status_into(self, channels: [int], row: numpy.ndarray, conditions: numpy.ndarray):
+        """
+        Measure voltage in [V], current in [A], and power in [W] and read questionable status condition of selected
+        channels in single bus transaction and store them in preallocated arrays, no per-sample objects are created.
+        Values of channels not listed are left untouched
+        :param channels: channels to interact with
+        :param row: float array of length PowerSupplyMeas.VALUES_QUANTITY * CHANNEL_MAX holding voltages of all
+        channels, then currents, then powers, value of channel n is at index n - 1 of its group
+        :param conditions: int array of length CHANNEL_MAX, condition of channel n is stored at index n - 1,
+        it can be decoded with channel_status_parse()
+        """
+        if len(channels) == 0:
+            return
+        channels = tuple(channels)
+        command = self.measure_status_commands.get(channels)
+        if command is None:
+            for channel in channels:
+                self.__validate_channel_index(channel)
+            command = ';:'.join(f"{RigolDP832Commands.MEASURE_ALL.value}{channel};:"
+                                f"{RigolDP832Commands.READ_CHANNEL_QUESTIONABLE_CONDITION.value}{channel}:COND?"
+                                for channel in channels)
+            self.measure_status_commands[channels] = command
+        self.instrument.write(command)
+        # Response is "voltage,current,power;condition" per channel, parsed without splitting into Python objects
+        values = numpy.fromstring(self.instrument.read_raw().replace(b';', b','), sep=',')
+        values = values.reshape(len(channels), PowerSupplyMeas.VALUES_QUANTITY + 1)
+        indexes = [channel - self.CHANNEL_MIN for channel in channels]
+        row.reshape(PowerSupplyMeas.VALUES_QUANTITY, self.CHANNEL_MAX)[:, indexes] = \
+            values[:, :PowerSupplyMeas.VALUES_QUANTITY].T
+        conditions[indexes] = values[:, PowerSupplyMeas.VALUES_QUANTITY]
+
     def channel_turn_on(self, channel: int):
         """
         Turn ON power supply channel
@@ -260,8 +933,8 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.TURN_ON_OFF_CHANNEL.value}{channel},ON"  # command to turn ON specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.TURN_ON_OFF_CHANNEL, command)
+        self.cache.update(channel, RigolDP832StateFields.OUTPUT_STATE, RigolDP832OutputStates.ON)
 
     def channel_turn_off(self, channel: int):
         """
@@ -270,8 +943,8 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.TURN_ON_OFF_CHANNEL.value}{channel},OFF"  # command to turn OFF specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.TURN_ON_OFF_CHANNEL, command)
+        self.cache.update(channel, RigolDP832StateFields.OUTPUT_STATE, RigolDP832OutputStates.OFF)
 
     def ovp_turn_on(self, channel: int):
         """
@@ -280,8 +953,8 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.SET_OVP.value}{channel},ON"  # command to turn ON OVP in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OVP, command)
+        self.cache.update(channel, RigolDP832StateFields.OVP_STATE, RigolDP832OutputProtectionStates.ON)
 
     def ovp_value_set(self, channel: int, limit_value: float):
         """
@@ -297,8 +970,8 @@ class RigolDP832:
             if self.OUTPUT_VOLTAGE_MAX < limit_value < self.OUTPUT_VOLTAGE_MIN:
                 raise ValueError("Error: Wrong Voltage limit value was given")
         command_limit = f"{RigolDP832Commands.SET_OVP_LIMIT.value}{channel},{limit_value}"  # command to set voltage limit
-        self.instrument.write(command_limit)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OVP_LIMIT, command_limit)
+        self.cache.update(channel, RigolDP832StateFields.OVP_VALUE, limit_value)
 
     def ovp_turn_off(self, channel: int):
         """
@@ -307,8 +980,8 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.SET_OVP.value}{channel},OFF"  # command to turn OFF OVP in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OVP, command)
+        self.cache.update(channel, RigolDP832StateFields.OVP_STATE, RigolDP832OutputProtectionStates.OFF)
 
     def ocp_turn_on(self, channel: int):
         """
@@ -317,8 +990,8 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.SET_OCP.value}{channel},ON"  # command to turn ON OCP in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OCP, command)
+        self.cache.update(channel, RigolDP832StateFields.OCP_STATE, RigolDP832OutputProtectionStates.ON)
 
     def ocp_value_set(self, channel: int, limit_value: float):
         """
@@ -330,8 +1003,8 @@ class RigolDP832:
         if self.OUTPUT_CURRENT_MAX < limit_value < self.OUTPUT_CURRENT_MIN:
             raise ValueError("Error: Wrong Current limit value was given")
         command_limit = f"{RigolDP832Commands.SET_OCP_LIMIT.value}{channel},{limit_value}"  # command to set current limit
-        self.instrument.write(command_limit)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OCP_LIMIT, command_limit)
+        self.cache.update(channel, RigolDP832StateFields.OCP_VALUE, limit_value)
 
     def ocp_turn_off(self, channel: int):
         """
@@ -340,78 +1013,295 @@ class RigolDP832:
         """
         self.__validate_channel_index(channel)
         command = f"{RigolDP832Commands.SET_OCP.value}{channel},OFF"  # command to turn OFF OCP in specific channel
-        self.instrument.write(command)  # send command to Rigol power supply
-        self.wait_for_ps_action()  # wait for Rigol power supply to execute command
+        self.send_command(RigolDP832Commands.SET_OCP, command)
+        self.cache.update(channel, RigolDP832StateFields.OCP_STATE, RigolDP832OutputProtectionStates.OFF)
+
+    def ovp_trip_clear(self, channel: int):
+        """
+        Clear latched OVP trip of channel, output can't be turned ON again until trip is cleared
+        :param channel: specific channel to interact with
+        """
+        self.__validate_channel_index(channel)
+        command = f"{RigolDP832Commands.CLEAR_OVP.value}{channel}"  # command to clear OVP trip in specific channel
+        self.send_command(RigolDP832Commands.CLEAR_OVP, command)
+
+    def ocp_trip_clear(self, channel: int):
+        """
+        Clear latched OCP trip of channel, output can't be turned ON again until trip is cleared
+        :param channel: specific channel to interact with
+        """
+        self.__validate_channel_index(channel)
+        command = f"{RigolDP832Commands.CLEAR_OCP.value}{channel}"  # command to clear OCP trip in specific channel
+        self.send_command(RigolDP832Commands.CLEAR_OCP, command)
 
-    def ovp_status_read(self, channel: int) -> RigolDP832OutputProtectionStates:
+    def ovp_status_read(self, channel: int, use_cache: bool = True) -> RigolDP832OutputProtectionStates:
         """
         Read status from ovp on selected channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached status if it is known
         :return: returns ovp status
         """
         self.__validate_channel_index(channel)
+        if use_cache:
+            status = self.cache.get(channel, RigolDP832StateFields.OVP_STATE)
+            if status is not None:
+                return status
         command = f"{RigolDP832Commands.READ_OVP_STATE.value}{channel}"  # command to get ovp status
-        status = self.instrument.query(command)  # query instrument with command to get ovp status
-        if status == f"{RigolDP832OutputProtectionStates.OFF.value}\n":
-            return RigolDP832OutputProtectionStates.OFF
-        elif status == f"{RigolDP832OutputProtectionStates.ON.value}\n":
-            return RigolDP832OutputProtectionStates.ON
+        output = self.instrument.query(command)  # query instrument with command to get ovp status
+        if output == f"{RigolDP832OutputProtectionStates.OFF.value}\n":
+            status = RigolDP832OutputProtectionStates.OFF
+        elif output == f"{RigolDP832OutputProtectionStates.ON.value}\n":
+            status = RigolDP832OutputProtectionStates.ON
         else:
-            return RigolDP832OutputProtectionStates.UNKNOWN
+            status = RigolDP832OutputProtectionStates.UNKNOWN
+        self.cache.update(channel, RigolDP832StateFields.OVP_STATE, status)
+        return status
 
-    def ocp_status_read(self, channel: int) -> RigolDP832OutputProtectionStates:
+    def ocp_status_read(self, channel: int, use_cache: bool = True) -> RigolDP832OutputProtectionStates:
         """
         Read status from ocp on selected channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached status if it is known
         :return: returns ocp status
         """
         self.__validate_channel_index(channel)
+        if use_cache:
+            status = self.cache.get(channel, RigolDP832StateFields.OCP_STATE)
+            if status is not None:
+                return status
         command = f"{RigolDP832Commands.READ_OCP_STATE.value}{channel}"  # command to get ocp status
-        status = self.instrument.query(command)  # query instrument with command to get ocp status
-        if status == f"{RigolDP832OutputProtectionStates.OFF.value}\n":
-            return RigolDP832OutputProtectionStates.OFF
-        elif status == f"{RigolDP832OutputProtectionStates.ON.value}\n":
-            return RigolDP832OutputProtectionStates.ON
+        output = self.instrument.query(command)  # query instrument with command to get ocp status
+        if output == f"{RigolDP832OutputProtectionStates.OFF.value}\n":
+            status = RigolDP832OutputProtectionStates.OFF
+        elif output == f"{RigolDP832OutputProtectionStates.ON.value}\n":
+            status = RigolDP832OutputProtectionStates.ON
         else:
-            return RigolDP832OutputProtectionStates.UNKNOWN
+            status = RigolDP832OutputProtectionStates.UNKNOWN
+        self.cache.update(channel, RigolDP832StateFields.OCP_STATE, status)
+        return status
 
-    def ovp_value_get(self, channel: int) -> float:
+    def ovp_value_get(self, channel: int, use_cache: bool = True) -> float:
         """
         Read value from ovp on selected channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached value if it is known
         :return: returns ovp value in [V]
         """
         self.__validate_channel_index(channel)
+        if use_cache:
+            ovp = self.cache.get(channel, RigolDP832StateFields.OVP_VALUE)
+            if ovp is not None:
+                return ovp
         command = f"{RigolDP832Commands.GET_OVP_VALUE.value}{channel}"  # command to get ovp value
         ovp = float(self.instrument.query(command))  # query instrument with command to get ovp value
+        self.cache.update(channel, RigolDP832StateFields.OVP_VALUE, ovp)
         return ovp
 
-    def ocp_value_get(self, channel: int) -> float:
+    def ocp_value_get(self, channel: int, use_cache: bool = True) -> float:
         """
         Read value from ocp on selected channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached value if it is known
         :return: returns ocp value in [A]
         """
         self.__validate_channel_index(channel)
+        if use_cache:
+            ocp = self.cache.get(channel, RigolDP832StateFields.OCP_VALUE)
+            if ocp is not None:
+                return ocp
         command = f"{RigolDP832Commands.GET_OCP_VALUE.value}{channel}"  # command to get ocp value
         ocp = float(self.instrument.query(command))  # query instrument with command to get ocp value
+        self.cache.update(channel, RigolDP832StateFields.OCP_VALUE, ocp)
         return ocp
 
-    def channel_state_read(self, channel: int) -> RigolDP832OutputStates:
+    def channel_state_read(self, channel: int, use_cache: bool = True) -> RigolDP832OutputStates:
         """
         Read status from selected channel
         :param channel: specific channel to interact with
+        :param use_cache: return cached status if it is known
         :return: returns channel status
         """
         self.__validate_channel_index(channel)
+        if use_cache:
+            state = self.cache.get(channel, RigolDP832StateFields.OUTPUT_STATE)
+            if state is not None:
+                return state
         command = f"{RigolDP832Commands.READ_CHANNEL_STATE.value}{channel}"  # command to get channel status
         output = self.instrument.query(command)
         if output == f"{RigolDP832OutputStates.ON.value}\n":
-            return RigolDP832OutputStates.ON
+            state = RigolDP832OutputStates.ON
         elif output == f"{RigolDP832OutputStates.OFF.value}\n":
-            return RigolDP832OutputStates.OFF
+            state = RigolDP832OutputStates.OFF
         else:
-            return RigolDP832OutputStates.UNKNOWN
+            state = RigolDP832OutputStates.UNKNOWN
+        self.cache.update(channel, RigolDP832StateFields.OUTPUT_STATE, state)
+        return state
+
+    def sweep_upload(self, channel: int, steps: [SweepStep], cycles: int = 1,
+                     end_state: RigolDP832TimerEndStates = RigolDP832TimerEndStates.LAST):
+        """
+        Upload voltage/current sequence to power supply timer, sequence is executed by instrument after sweep_start
+        :param channel: specific channel to interact with
+        :param steps: list of sequence steps
+        :param cycles: number of sequence repetitions, infinite if None
+        :param end_state: output state after finished sequence
+        """
+        self.__validate_channel_index(channel)
+        if not 0 < len(steps) <= self.TIMER_GROUPS_MAX:
+            raise ValueError(f"Error: Number of steps out of range [1;{self.TIMER_GROUPS_MAX}]")
+        if cycles is not None and not 0 < cycles <= self.TIMER_CYCLES_MAX:
+            raise ValueError(f"Error: Number of cycles out of range [1;{self.TIMER_CYCLES_MAX}]")
+        for step in steps:
+            if not self.TIMER_DWELL_MIN <= step.dwell <= self.TIMER_DWELL_MAX:
+                raise ValueError(f"Error: Step time out of range [{self.TIMER_DWELL_MIN};{self.TIMER_DWELL_MAX}]")
+
+        self.channel_select(channel)  # timer works on selected channel
+        for first in range(0, len(steps), self.TIMER_UPLOAD_CHUNK):
+            chunk = steps[first:first + self.TIMER_UPLOAD_CHUNK]
+            command = ';:'.join(f"{RigolDP832Commands.TIMER_PARAMETER.value} {first + index},{step.voltage},{step.current},{step.dwell}"
+                                for index, step in enumerate(chunk))
+            self.send_command(RigolDP832Commands.TIMER_PARAMETER, command)
+        cycles_value = 'I' if cycles is None else f"N,{cycles}"
+        command = (f"{RigolDP832Commands.TIMER_GROUPS.value} {len(steps)};"
+                   f":{RigolDP832Commands.TIMER_CYCLES.value} {cycles_value};"
+                   f":{RigolDP832Commands.TIMER_END_STATE.value} {end_state.value}")
+        self.send_command(RigolDP832Commands.TIMER_GROUPS, command)
+        self.sweeps[channel] = (list(steps), cycles)
+
+    def ramp_upload(self, channel: int, start_voltage: float, stop_voltage: float, points: int, current: float,
+                    dwell: float, cycles: int = 1, end_state: RigolDP832TimerEndStates = RigolDP832TimerEndStates.LAST):
+        """
+        Upload linear voltage ramp to power supply timer
+        :param channel: specific channel to interact with
+        :param start_voltage: voltage in [V] of first step
+        :param stop_voltage: voltage in [V] of last step
+        :param points: number of steps, at least 2
+        :param current: current in [A] of all steps
+        :param dwell: time in [s] of every step
+        :param cycles: number of ramp repetitions, infinite if None
+        :param end_state: output state after finished ramp
+        """
+        if points < 2:
+            raise ValueError("Error: Ramp needs at least 2 points")
+        step_voltage = (stop_voltage - start_voltage) / (points - 1)
+        steps = [SweepStep(round(start_voltage + index * step_voltage, 3), current, dwell) for index in range(points)]
+        self.sweep_upload(channel, steps, cycles, end_state)
+
+    def sweep_start(self, channel: int):
+        """
+        Start uploaded timer sequence, it runs only while channel output is ON
+        :param channel: specific channel to interact with
+        """
+        self.__validate_channel_index(channel)
+        self.channel_select(channel)
+        self.send_command(RigolDP832Commands.TIMER_STATE, f"{RigolDP832Commands.TIMER_STATE.value} ON")
+        self.sweeps_start_time[channel] = time.monotonic()
+        self.cache.update(channel, RigolDP832StateFields.VOLTAGE_SET, None)  # set values are changed by timer
+        self.cache.update(channel, RigolDP832StateFields.CURRENT_SET, None)
+
+    def sweep_stop(self, channel: int):
+        """
+        Stop timer sequence
+        :param channel: specific channel to interact with
+        """
+        self.__validate_channel_index(channel)
+        self.channel_select(channel)
+        self.send_command(RigolDP832Commands.TIMER_STATE, f"{RigolDP832Commands.TIMER_STATE.value} OFF")
+        self.sweeps_start_time.pop(channel, None)
+        self.cache.update(channel, RigolDP832StateFields.VOLTAGE_SET, None)
+        self.cache.update(channel, RigolDP832StateFields.CURRENT_SET, None)
+
+    def sweep_progress(self, channel: int) -> SweepProgress:
+        """
+        Read progress of timer sequence, only timer state is queried, step is computed from uploaded step times
+        :param channel: specific channel to interact with
+        :return: progress of timer sequence
+        """
+        self.__validate_channel_index(channel)
+        self.channel_select(channel)
+        running = self.instrument.query(RigolDP832Commands.READ_TIMER_STATE.value) == "ON\n"
+        start_time = self.sweeps_start_time.get(channel)
+        if channel not in self.sweeps or start_time is None:
+            return SweepProgress(running)
+
+        steps, cycles = self.sweeps[channel]
+        step_ends = list(numpy.cumsum([step.dwell for step in steps]))
+        elapsed = time.monotonic() - start_time
+        cycle, cycle_time = divmod(elapsed, step_ends[-1])
+        if cycles is not None and cycle >= cycles:
+            return SweepProgress(running, len(steps) - 1, cycles - 1, elapsed)
+        return SweepProgress(running, bisect.bisect_right(step_ends, cycle_time), int(cycle), elapsed)
+
+    def __validate_recorder_location(self, location: int):
+        """
+        Validate if record file location is within range
+        :param location: record file location in internal memory
+        """
+        if not self.RECORDER_LOCATION_MIN <= location <= self.RECORDER_LOCATION_MAX:
+            raise ValueError(f"Error: Record file location out of range [{self.RECORDER_LOCATION_MIN};{self.RECORDER_LOCATION_MAX}]")
+
+    def recorder_configure(self, period: int, location: int = RECORDER_LOCATION_MAX, filename: str = 'RIGOL'):
+        """
+        Set record period and record file of power supply recorder, recorder samples outputs of all channels
+        :param period: record period in [s]
+        :param location: record file location in internal memory
+        :param filename: name of record file, up to 9 characters
+        """
+        if not self.RECORDER_PERIOD_MIN <= period <= self.RECORDER_PERIOD_MAX:
+            raise ValueError(f"Error: Record period out of range [{self.RECORDER_PERIOD_MIN};{self.RECORDER_PERIOD_MAX}]")
+        self.__validate_recorder_location(location)
+        command = (f"{RigolDP832Commands.RECORDER_PERIOD.value} {int(period)};"
+                   f":{RigolDP832Commands.RECORDER_MEMORY.value} {location},{filename}")
+        self.send_command(RigolDP832Commands.RECORDER_PERIOD, command)
+
+    def recorder_start(self):
+        """
+        Start recording outputs, recorded data of channels with disabled output is 0
+        """
+        self.send_command(RigolDP832Commands.RECORDER_STATE, f"{RigolDP832Commands.RECORDER_STATE.value} ON")
+
+    def recorder_stop(self):
+        """
+        Stop recording outputs, power supply stores record file to configured location
+        """
+        self.send_command(RigolDP832Commands.RECORDER_STATE, f"{RigolDP832Commands.RECORDER_STATE.value} OFF")
+
+    @staticmethod
+    def __parse_analyzer_value(data: str) -> (float, float, float):
+        """
+        Parse ANAL:VAL? response, for example Volt:1.2817V,Curr:0.0485A,Power:0.0622W
+        :param data: response of single ANAL:VAL? query
+        :return: voltage in [V], current in [A] and power in [W]
+        """
+        voltage, current, power = (float(element.split(':')[1][:-1]) for element in data.split(','))
+        return voltage, current, power
+
+    def recorder_download(self, channel: int, location: int = RECORDER_LOCATION_MAX) -> numpy.ndarray:
+        """
+        Read recorded data of channel with power supply analyzer, many points are read in each compound query.
+        Analyzer is an option on DP832 (standard on DP832A) and reaches at most 2048 record periods
+        :param channel: specific channel to interact with
+        :param location: record file location in internal memory
+        :return: array of shape (points, 4) with columns time in [s], voltage in [V], current in [A] and power in [W]
+        """
+        self.__validate_channel_index(channel)
+        self.__validate_recorder_location(location)
+        self.send_command(RigolDP832Commands.ANALYZER_MEMORY, f"{RigolDP832Commands.ANALYZER_MEMORY.value} {location}")
+        self.channel_select(channel)  # analyzer shows data of selected channel
+        command = (f"{RigolDP832Commands.READ_RECORDER_PERIOD.value};"
+                   f":{RigolDP832Commands.READ_ANALYZER_START_TIME.value};"
+                   f":{RigolDP832Commands.READ_ANALYZER_END_TIME.value}")
+        period, start_time, end_time = (int(value) for value in self.instrument.query(command).strip().split(';'))
+
+        times = range(start_time, end_time + 1, period)
+        data = numpy.empty((len(times), 4))
+        for first in range(0, len(times), self.RECORDER_DOWNLOAD_CHUNK):
+            chunk = times[first:first + self.RECORDER_DOWNLOAD_CHUNK]
+            command = ';:'.join(f"{RigolDP832Commands.READ_ANALYZER_VALUE.value} {point}" for point in chunk)
+            values = self.instrument.query(command).strip().split(';')
+            for index, (point, value) in enumerate(zip(chunk, values)):
+                data[first + index] = (point, *self.__parse_analyzer_value(value))
+        return data
 
     def channel_mode_read(self, channel: int) -> RigolDP832OutputModes:
         """
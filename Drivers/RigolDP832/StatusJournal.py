@@ -0,0 +1,134 @@
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+
+@dataclass(frozen=True)
+class StatusRecord:
+    """
+    Class for storing single registered channel status
+    """
+    timestamp: float  # Time in [s] from time.monotonic()
+    channel: int
+    state: Enum
+
+    def __str__(self):
+        return f"[{self.timestamp:.3f}] Channel {self.channel} status: {self.state.value}"
+
+
+class StatusJournal:
+    """
+    Class for storing channel statuses in fixed-capacity ring buffer, oldest records are dropped
+    or spilled to file when buffer is full. Records are kept in time order, so queries bisect timestamps
+    """
+    CAPACITY_DEFAULT = 10000  # Number of records kept in memory
+    SPILL_CHUNK = 100  # Number of dropped records collected before they are appended to spill file
+
+    def __init__(self, capacity: int = CAPACITY_DEFAULT, spill_path: str = None):
+        """
+        Class initialization
+        :param capacity: max number of records kept in memory
+        :param spill_path: path of file that records dropped from buffer are appended to, records are discarded if None
+        """
+        if capacity <= 0:
+            raise ValueError("Error: Journal capacity must be positive")
+        self.capacity = capacity
+        self.records = [None] * capacity
+        self.head = 0  # Position of oldest record
+        self.count = 0  # Number of records kept in memory
+        self.spill_path = spill_path
+        self.spill_pending = []
+        self.dropped = 0  # Number of records removed from memory
+
+    def append(self, channel: int, state: Enum, timestamp: float = None) -> StatusRecord:
+        """
+        Add status record to journal
+        :param channel: channel of registered status
+        :param state: registered status
+        :param timestamp: time in [s] from time.monotonic(), current time if None, must not be older than last record
+        :return: added record
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self.count > 0 and timestamp < self.__record(self.count - 1).timestamp:
+            raise ValueError("Error: Journal records must be appended in time order")
+        record = StatusRecord(timestamp, channel, state)
+        if self.count == self.capacity:
+            self.__spill(self.records[self.head])
+            self.records[self.head] = record
+            self.head = (self.head + 1) % self.capacity
+        else:
+            self.records[(self.head + self.count) % self.capacity] = record
+            self.count += 1
+        return record
+
+    def __record(self, index: int) -> StatusRecord:
+        """
+        Return record by its position in time order
+        :param index: position of record, 0 is oldest record
+        """
+        return self.records[(self.head + index) % self.capacity]
+
+    def __bisect(self, timestamp: float, right: bool) -> int:
+        """
+        Find position of timestamp in records
+        :param timestamp: searched time in [s]
+        :param right: True to return position after records with equal timestamp, False to return position before them
+        :return: position in range [0;count]
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            middle_timestamp = self.__record(middle).timestamp
+            if middle_timestamp < timestamp or (right and middle_timestamp == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __spill(self, record: StatusRecord):
+        """
+        Collect record that is going to be removed from buffer and write collected records to spill file in chunks
+        :param record: record to be written
+        """
+        self.dropped += 1
+        if self.spill_path is None:
+            return
+        self.spill_pending.append(f"{record.timestamp},{record.channel},{record.state.value}\n")
+        if len(self.spill_pending) >= self.SPILL_CHUNK:
+            self.flush()
+
+    def flush(self):
+        """
+        Write collected dropped records to spill file
+        """
+        if self.spill_path is None or len(self.spill_pending) == 0:
+            return
+        with open(self.spill_path, 'a') as file:
+            file.writelines(self.spill_pending)
+        self.spill_pending = []
+
+    def query(self, channel: int = None, start: float = None, end: float = None) -> [StatusRecord]:
+        """
+        Return records kept in memory matching filters
+        :param channel: return only records of this channel, all channels if None
+        :param start: return only records with timestamp >= start, no lower limit if None
+        :param end: return only records with timestamp <= end, no upper limit if None
+        :return: list of matching records ordered by time
+        """
+        first = 0 if start is None else self.__bisect(start, False)
+        last = self.count if end is None else self.__bisect(end, True)
+        records = (self.__record(index) for index in range(first, last))
+        return [record for record in records if channel is None or record.channel == channel]
+
+    def clear(self):
+        """
+        Remove all records kept in memory, collected dropped records are written to spill file first
+        """
+        self.flush()
+        self.records = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,314 @@
+import bisect
+import json
+import threading
+import time
+
+
+class LatencyHistogram:
+    """
+    Class for storing latency distribution in fixed logarithmic buckets, memory use does not grow with sample count
+    """
+    # Upper bucket edges in [s] from 10us to 100s, 20 buckets per decade (~12% wide),
+    # longer samples are counted in overflow bucket
+    EDGES = [1e-5 * 10 ** (index / 20) for index in range(141)]
+
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.buckets = [0] * (len(self.EDGES) + 1)
+        self.count = 0
+        self.total = 0.0  # Time in [s]
+        self.max = 0.0  # Time in [s]
+
+    def register(self, elapsed_time: float):
+        """
+        Add single sample to histogram
+        :param elapsed_time: duration in [s]
+        """
+        self.buckets[bisect.bisect_left(self.EDGES, elapsed_time)] += 1
+        self.count += 1
+        self.total += elapsed_time
+        self.max = max(self.max, elapsed_time)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return estimated percentile of samples, value is upper edge of bucket holding it
+        :param percent: percentile in range [0;100]
+        :return: time in [s], 0 if there are no samples
+        """
+        if self.count == 0:
+            return 0.0
+        rank = percent / 100 * self.count
+        cumulative = 0
+        for index, samples in enumerate(self.buckets):
+            cumulative += samples
+            if cumulative >= rank and samples > 0:
+                return min(self.EDGES[index], self.max) if index < len(self.EDGES) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        """
+        Return statistics of samples
+        :return: dictionary of count, total, mean, p50, p95, p99 and max, times in [s]
+        """
+        return {'count': self.count,
+                'total': self.total,
+                'mean': self.total / self.count if self.count else 0.0,
+                'p50': self.percentile(50),
+                'p95': self.percentile(95),
+                'p99': self.percentile(99),
+                'max': self.max}
+
+
+class TransactionStats:
+    """
+    Class for storing statistics of single command sent to single device
+    """
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.latency = LatencyHistogram()
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def summary(self) -> dict:
+        """
+        Return statistics of command
+        :return: latency statistics extended with transferred bytes
+        """
+        summary = self.latency.summary()
+        summary['bytes_written'] = self.bytes_written
+        summary['bytes_read'] = self.bytes_read
+        return summary
+
+
+class TransactionProfiler:
+    """
+    Class for collecting per-command latency, transferred bytes and lock wait time of instrument transactions.
+    Profiling is opt-in, enable it before instruments are connected:
+    profiler = TransactionProfiler.enable()
+    """
+    __active = None
+    __active_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self.lock = threading.Lock()
+        self.transactions = {}  # (device, command): TransactionStats
+        self.lock_waits = {}  # device: LatencyHistogram
+        self.start_time = time.time()
+
+    @classmethod
+    def enable(cls) -> 'TransactionProfiler':
+        """
+        Enable profiling of instruments connected from now on
+        :return: active profiler, existing one is returned if profiling is already enabled
+        """
+        with cls.__active_lock:
+            if cls.__active is None:
+                cls.__active = cls()
+            return cls.__active
+
+    @classmethod
+    def disable(cls):
+        """
+        Stop profiling of instruments connected from now on, already wrapped sessions keep reporting to old profiler
+        """
+        with cls.__active_lock:
+            cls.__active = None
+
+    @classmethod
+    def active(cls):
+        """
+        Return active profiler
+        :return: active TransactionProfiler, None if profiling is disabled
+        """
+        return cls.__active
+
+    @staticmethod
+    def command_name(message: str) -> str:
+        """
+        Extract command headers from SCPI message, parameters are dropped
+        :param message: SCPI message, compound messages are supported
+        :return: headers of all commands joined with ';'
+        """
+        return ';'.join(part.strip().lstrip(':').split(' ', 1)[0] for part in message.split(';'))
+
+    def transaction_register(self, device: str, command: str, elapsed_time: float,
+                             bytes_written: int = 0, bytes_read: int = 0):
+        """
+        Add single transaction to statistics
+        :param device: name or address of device
+        :param command: name of command
+        :param elapsed_time: transaction duration in [s]
+        :param bytes_written: number of bytes sent to device
+        :param bytes_read: number of bytes received from device
+        """
+        with self.lock:
+            stats = self.transactions.get((device, command))
+            if stats is None:
+                stats = self.transactions[(device, command)] = TransactionStats()
+            stats.latency.register(elapsed_time)
+            stats.bytes_written += bytes_written
+            stats.bytes_read += bytes_read
+
+    def lock_wait_register(self, device: str, elapsed_time: float):
+        """
+        Add single lock acquisition to statistics
+        :param device: name or address of device guarded by lock
+        :param elapsed_time: time in [s] spent waiting for lock
+        """
+        with self.lock:
+            histogram = self.lock_waits.get(device)
+            if histogram is None:
+                histogram = self.lock_waits[device] = LatencyHistogram()
+            histogram.register(elapsed_time)
+
+    def report(self) -> dict:
+        """
+        Return statistics collected so far
+        :return: dictionary with 'transactions' {device: {command: stats}} and 'lock_wait' {device: stats}
+        """
+        with self.lock:
+            transactions = {}
+            for (device, command), stats in self.transactions.items():
+                transactions.setdefault(device, {})[command] = stats.summary()
+            return {'duration': time.time() - self.start_time,
+                    'transactions': transactions,
+                    'lock_wait': {device: histogram.summary() for device, histogram in self.lock_waits.items()}}
+
+    def dump_json(self, path: str):
+        """
+        Write statistics collected so far to JSON file
+        :param path: path of output file
+        """
+        with open(path, 'w') as file:
+            json.dump(self.report(), file, indent=2)
+
+    def reset(self):
+        """
+        Remove all collected statistics
+        """
+        with self.lock:
+            self.transactions.clear()
+            self.lock_waits.clear()
+            self.start_time = time.time()
+
+
+class ProfiledSession:
+    """
+    Class wrapping VISA session, write/query/read transactions are timed and reported to profiler,
+    every other attribute is passed to wrapped session
+    """
+    def __init__(self, session, profiler: TransactionProfiler, device: str):
+        """
+        Class initialization
+        :param session: VISA session to be wrapped
+        :param profiler: profiler collecting statistics
+        :param device: name or address of device
+        """
+        object.__setattr__(self, 'session', session)
+        object.__setattr__(self, 'profiler', profiler)
+        object.__setattr__(self, 'device', device)
+        object.__setattr__(self, 'last_command', '')  # Command that next read is accounted to
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.session, name, value)
+
+    def write(self, message: str, *args, **kwargs):
+        command = self.profiler.command_name(message)
+        object.__setattr__(self, 'last_command', command)
+        start_time = time.perf_counter()
+        result = self.session.write(message, *args, **kwargs)
+        self.profiler.transaction_register(self.device, command, time.perf_counter() - start_time,
+                                           bytes_written=len(message) + 1)
+        return result
+
+    def query(self, message: str, *args, **kwargs) -> str:
+        command = self.profiler.command_name(message)
+        start_time = time.perf_counter()
+        response = self.session.query(message, *args, **kwargs)
+        self.profiler.transaction_register(self.device, command, time.perf_counter() - start_time,
+                                           bytes_written=len(message) + 1, bytes_read=len(response))
+        return response
+
+    def read(self, *args, **kwargs) -> str:
+        start_time = time.perf_counter()
+        response = self.session.read(*args, **kwargs)
+        self.profiler.transaction_register(self.device, f"{self.last_command} (read)",
+                                           time.perf_counter() - start_time, bytes_read=len(response))
+        return response
+
+    def read_raw(self, *args, **kwargs) -> bytes:
+        start_time = time.perf_counter()
+        response = self.session.read_raw(*args, **kwargs)
+        self.profiler.transaction_register(self.device, f"{self.last_command} (read)",
+                                           time.perf_counter() - start_time, bytes_read=len(response))
+        return response
+
+
+class ProfiledLock:
+    """
+    Class wrapping lock, time spent waiting for acquisition is reported to profiler
+    """
+    def __init__(self, lock, profiler: TransactionProfiler, device: str):
+        """
+        Class initialization
+        :param lock: lock to be wrapped
+        :param profiler: profiler collecting statistics
+        :param device: name or address of device guarded by lock
+        """
+        self.lock = lock
+        self.profiler = profiler
+        self.device = device
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start_time = time.perf_counter()
+        acquired = self.lock.acquire(blocking, timeout)
+        self.profiler.lock_wait_register(self.device, time.perf_counter() - start_time)
+        return acquired
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class ProfiledLibrary:
+    """
+    Class wrapping driver library module, calls of its functions are timed and reported to profiler
+    """
+    def __init__(self, library, profiler: TransactionProfiler, device: str):
+        """
+        Class initialization
+        :param library: library object with callable attributes
+        :param profiler: profiler collecting statistics
+        :param device: name of device
+        """
+        self.library = library
+        self.profiler = profiler
+        self.device = device
+
+    def __getattr__(self, name):
+        attribute = getattr(self.library, name)
+        if not callable(attribute):
+            return attribute
+
+        def profiled(*args, **kwargs):
+            start_time = time.perf_counter()
+            result = attribute(*args, **kwargs)
+            self.profiler.transaction_register(self.device, name, time.perf_counter() - start_time)
+            return result
+        return profiled
@@ -0,0 +1,168 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pyvisa
+
+from Drivers.TransactionProfiler import TransactionProfiler, ProfiledSession, ProfiledLock
+
+
+class VisaConnectionPool:
+    """
+    Process-wide pool of VISA sessions, all drivers share one ResourceManager and reuse sessions opened by address
+    """
+    RECONNECT_TIME_MIN = 0.25  # Time in [s] to wait before first reconnection attempt
+    RECONNECT_TIME_MAX = 4.0  # Max time in [s] between reconnection attempts
+    RECONNECT_BACKOFF_FACTOR = 2.0  # Multiplier of wait time after every failed attempt
+    CONNECT_WORKERS = 4  # Number of threads used to open sessions in background
+
+    __resource_manager = None
+    __sessions = {}
+    __address_locks = {}
+    __resource_locks = {}
+    __session_states = {}
+    __lock = threading.Lock()
+    __executor = None
+
+    @classmethod
+    def resource_manager(cls) -> pyvisa.ResourceManager:
+        """
+        Return shared ResourceManager, it is created on first use
+        :return: shared ResourceManager
+        """
+        with cls.__lock:
+            if cls.__resource_manager is None:
+                cls.__resource_manager = pyvisa.ResourceManager()
+            return cls.__resource_manager
+
+    @classmethod
+    def __address_lock(cls, address: str) -> threading.Lock:
+        """
+        Return lock guarding opening of session with address
+        :param address: address of instrument
+        """
+        with cls.__lock:
+            return cls.__address_locks.setdefault(address, threading.Lock())
+
+    @classmethod
+    def resource_lock(cls, address: str) -> threading.RLock:
+        """
+        Return lock guarding communication with instrument, every address has its own lock,
+        so instruments on separate sessions can be used in parallel
+        :param address: address of instrument
+        :return: reentrant lock shared by all users of address, wrapped with ProfiledLock if profiling is enabled
+        """
+        with cls.__lock:
+            lock = cls.__resource_locks.setdefault(address, threading.RLock())
+        profiler = TransactionProfiler.active()
+        if profiler is not None:
+            return ProfiledLock(lock, profiler, address)
+        return lock
+
+    @classmethod
+    def session_state(cls, address: str) -> dict:
+        """
+        Return dictionary for instrument state that belongs to session rather than to driver instance,
+        e.g. selected channel, every driver sharing session with address sees the same dictionary
+        :param address: address of instrument
+        :return: mutable dictionary shared by all users of address, it is emptied when session is closed
+        """
+        with cls.__lock:
+            return cls.__session_states.setdefault(address, {})
+
+    @classmethod
+    def open(cls, address: str, time_out: float = 10, **kwargs):
+        """
+        Return session with instrument, open it if there is no cached one. While instrument is busy
+        opening is retried with exponential backoff until time_out passes
+        :param address: address of instrument to connect with
+        :param time_out: time in [s] before connection timeout
+        :param kwargs: additional arguments passed to ResourceManager.open_resource
+        :return: opened VISA session, wrapped with ProfiledSession if profiling is enabled
+        """
+        session = cls.__session_open(address, time_out, **kwargs)
+        profiler = TransactionProfiler.active()
+        if profiler is not None:
+            return ProfiledSession(session, profiler, address)
+        return session
+
+    @classmethod
+    def __session_open(cls, address: str, time_out: float, **kwargs):
+        """
+        Return cached session with instrument, open it if there is no cached one
+        :param address: address of instrument to connect with
+        :param time_out: time in [s] before connection timeout
+        :param kwargs: additional arguments passed to ResourceManager.open_resource
+        :return: opened VISA session
+        """
+        with cls.__address_lock(address):
+            session = cls.__sessions.get(address)
+            if session is not None:
+                return session
+
+            rm = cls.resource_manager()
+            start_time = time.time()
+            reconnect_time = cls.RECONNECT_TIME_MIN
+            while session is None:
+                try:
+                    session = rm.open_resource(address, **kwargs)
+                except pyvisa.VisaIOError:
+                    if rm.last_status != pyvisa.constants.StatusCode.error_resource_busy:
+                        raise ConnectionError(f"Can't connect to device")
+                    remaining_time = time_out - (time.time() - start_time)
+                    if remaining_time <= 0:
+                        raise ConnectionError(f"Can't connect to device")
+                    logging.error(f"Failed to connect, instrument is busy, try again in {reconnect_time}s")
+                    time.sleep(min(reconnect_time, remaining_time))
+                    reconnect_time = min(reconnect_time * cls.RECONNECT_BACKOFF_FACTOR, cls.RECONNECT_TIME_MAX)
+
+            cls.__sessions[address] = session
+            return session
+
+    @classmethod
+    def open_async(cls, address: str, time_out: float = 10, **kwargs) -> Future:
+        """
+        Open session with instrument in background thread
+        :param address: address of instrument to connect with
+        :param time_out: time in [s] before connection timeout
+        :param kwargs: additional arguments passed to ResourceManager.open_resource
+        :return: future resolved with opened VISA session or with ConnectionError
+        """
+        return cls.run_async(cls.open, address, time_out, **kwargs)
+
+    @classmethod
+    def run_async(cls, function, *args, **kwargs) -> Future:
+        """
+        Run blocking connection or initialization function in background thread
+        :param function: function to be called
+        :param args: arguments passed to function
+        :param kwargs: keyword arguments passed to function
+        :return: future resolved with value returned by function or with raised exception
+        """
+        with cls.__lock:
+            if cls.__executor is None:
+                cls.__executor = ThreadPoolExecutor(max_workers=cls.CONNECT_WORKERS, thread_name_prefix='visa-connect')
+            executor = cls.__executor
+        return executor.submit(function, *args, **kwargs)
+
+    @classmethod
+    def is_open(cls, address: str) -> bool:
+        """
+        Check if there is cached session with instrument
+        :param address: address of instrument
+        :return: True if session is cached
+        """
+        return address in cls.__sessions
+
+    @classmethod
+    def close(cls, address: str):
+        """
+        Close session with instrument and remove it from pool
+        :param address: address of instrument
+        """
+        with cls.__address_lock(address):
+            session = cls.__sessions.pop(address, None)
+            if session is not None:
+                session.close()
+            cls.session_state(address).clear()
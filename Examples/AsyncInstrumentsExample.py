@@ -0,0 +1,17 @@
+import asyncio
+from Drivers.AsyncInstrument import poll_instruments
+from Drivers.RigolDP832.AsyncRIGOL832 import AsyncRigolDP832
+from Drivers.Keithley2308.AsyncKeithley2308 import AsyncKeithley2308
+
+
+async def main():
+    Rigol = await AsyncRigolDP832.connect()  # Connect to Rigol DP832 without blocking event loop
+    Keithley = await AsyncKeithley2308.connect()  # Connect to Keithley 2308 without blocking event loop
+    await Rigol.output_voltage_set(1, 5)  # Every driver method is awaitable
+    print(await poll_instruments(Rigol, Keithley))  # Poll both instruments at once
+    Rigol.close()
+    Keithley.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
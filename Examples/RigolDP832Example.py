@@ -1,17 +1,21 @@
-from RigolDP832.RIGOL832 import RigolDP832
+from RigolDP832.RIGOL832 import RigolDP832, RigolDP832Commands
 
 if __name__ == "__main__":
     Rigol = RigolDP832()  # Create instance of Rigol DP832
     Rigol.channel_turn_on(1)  # Turn ON power supply channel [1]
     Rigol.channel_turn_off(1)  # Turn OFF power supply channel [1]
-    Rigol.register_status(1)  # Register status of channel in list as string
+    Rigol.register_status(1)  # Register status of channel in status journal
+    print(Rigol.status_journal.query(channel=1))  # Read registered statuses of channel [1]
     Rigol.output_voltage_set(1, 15)  # Set power supply output voltage to 15V on channel [1]
     print(Rigol.output_voltage_measure(1))  # Get power supply output voltage on channel [1]
     Rigol.output_current_set(1, 3)  # Set power supply output current to 3A on channel [1]
+    Rigol.output_apply(1, 5, 0.5)  # Set power supply output voltage to 5V and current to 0.5A on channel [1]
     print(Rigol.output_current_measure(1))  # Get power supply output current on channel [1]
     print(Rigol.output_voltage_value_get(1))  # Get power supply output voltage of channel [1]
     print(Rigol.output_current_value_get(1))  # Get power supply output current of channel [1]
     print(Rigol.measure_all_values(1))  # Measure voltage in [V], current in [A], and power in [W] on specified channel
+    print(Rigol.measure_all_channels())  # Measure voltage, current and power on all channels in single query
+    print(Rigol.measure_channels_status([1, 2]))  # Measure values and read CV/CC mode and OVP/OCP trips of channels [1] and [2] in single query
     Rigol.ovp_turn_on(1)  # Turn ON power supply OVP on channel [1]
     Rigol.ovp_turn_off(1)  # Turn OFF power supply OVP on channel [1]
     Rigol.ovp_value_set(1, 12)  # Set value of OVP Voltage limit to 12V on channel [1]
@@ -24,3 +28,13 @@ if __name__ == "__main__":
     print(Rigol.ocp_status_read(1))  # Read status from OCP on channel [1]
     print(Rigol.channel_state_read(1))  # Read status from channel [1]
     print(Rigol.channel_mode_read(1))  # Read mode from channel [1]
+    print(Rigol.snapshot())  # Read settings, states and modes of all channels in single query
+    Rigol.settle_time_set(RigolDP832Commands.TURN_ON_OFF_CHANNEL, 0.1)  # Wait 100ms for output to settle after turning channel ON/OFF
+    print(Rigol.command_stats)  # Execution time statistics of written commands
+    Rigol.ramp_upload(1, 0, 12, 13, 1, 2)  # Upload 0V to 12V ramp in 1V steps of 2s with 1A limit to timer of channel [1]
+    Rigol.sweep_start(1)  # Start uploaded ramp, it is executed by power supply
+    print(Rigol.sweep_progress(1))  # Read progress of running ramp
+    Rigol.recorder_configure(5)  # Record outputs of all channels every 5s to default record file
+    Rigol.recorder_start()  # Start recording, power supply samples outputs without bus traffic
+    Rigol.recorder_stop()  # Stop recording and store record file
+    print(Rigol.recorder_download(1))  # Read recorded time, voltage, current and power of channel [1]
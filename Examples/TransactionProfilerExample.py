@@ -0,0 +1,10 @@
+from Drivers.TransactionProfiler import TransactionProfiler
+from Drivers.RigolDP832.RIGOL832 import RigolDP832
+
+if __name__ == "__main__":
+    profiler = TransactionProfiler.enable()  # Enable profiling before instruments are connected
+    Rigol = RigolDP832()  # Every transaction of this instance is timed
+    for _ in range(100):
+        Rigol.measure_all_channels()  # Measure voltage, current and power on all channels in single query
+    print(profiler.report())  # Read per-command count, p50/p95/p99 latency, bytes and lock wait time
+    profiler.dump_json('transactions.json')  # Save statistics for later analysis
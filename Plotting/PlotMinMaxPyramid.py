@@ -0,0 +1,86 @@
+import numpy
+
+from Plotting.PlotRingBuffer import PlotRingBuffer
+
+
+class PlotMinMaxPyramid:
+    """
+    Class for storing multi-resolution min/max summary of plot history. Level k keeps min and max of every value column
+    over buckets of FACTOR^k consecutive samples, levels are updated incrementally on every append, so any time range
+    can be drawn from at most 2 points per pixel without losing spikes
+    """
+    FACTOR = 4  # Number of buckets of lower level summarized by one bucket of next level
+
+    def __init__(self, history: PlotRingBuffer, time_column: int = 0):
+        """
+        Class initialization
+        :param history: buffer of raw samples used as level 0, samples must be appended through pyramid
+        :param time_column: index of column holding time of sample, it must be increasing
+        """
+        self.history = history
+        self.time_column = time_column
+        self.appended = 0  # Number of samples appended since last clear, absolute index of next sample
+        columns, capacity = history.data.shape[0], history.capacity
+        self.levels = []  # [(bucket size, time of first sample, min of columns, max of columns)]
+        bucket_size = self.FACTOR
+        while bucket_size < capacity:
+            # Buffer of raw samples spans at most capacity / bucket_size + 2 buckets
+            buckets = capacity // bucket_size + 2
+            self.levels.append((bucket_size, numpy.zeros(buckets), numpy.zeros((columns, buckets)),
+                                numpy.zeros((columns, buckets))))
+            bucket_size *= self.FACTOR
+
+    def append(self, sample):
+        """
+        Add sample to history and update bucket holding it on every level
+        :param sample: sequence of values, one for every column
+        """
+        self.history.append(sample)
+        values = numpy.asarray(sample, dtype=float)
+        for bucket_size, times, minimums, maximums in self.levels:
+            position = (self.appended // bucket_size) % len(times)
+            if self.appended % bucket_size == 0:
+                times[position] = values[self.time_column]
+                minimums[:, position] = values
+                maximums[:, position] = values
+            else:
+                numpy.minimum(minimums[:, position], values, out=minimums[:, position])
+                numpy.maximum(maximums[:, position], values, out=maximums[:, position])
+        self.appended += 1
+
+    def window(self, column: int, time_start: float, time_end: float, buckets_max: int):
+        """
+        Return samples of column in time range, decimated to at most buckets_max min/max pairs
+        :param column: index of column
+        :param time_start: start of time range, one sample before it is included so line reaches edge of view
+        :param time_end: end of time range, one sample after it is included so line reaches edge of view
+        :param buckets_max: max number of buckets, usually width of plot in pixels
+        :return: tuple of (time, values) arrays, raw samples are returned as views of history if they fit in limit
+        """
+        times = self.history.view(self.time_column)
+        first = max(int(numpy.searchsorted(times, time_start, 'left')) - 1, 0)
+        last = min(int(numpy.searchsorted(times, time_end, 'right')) + 1, len(times))
+        if last - first <= 2 * buckets_max or len(self.levels) == 0:
+            return times[first:last], self.history.view(column)[first:last]
+        offset = self.appended - len(times)  # Absolute index of oldest sample in history
+        for bucket_size, level_times, minimums, maximums in self.levels:
+            bucket_first = (offset + first) // bucket_size
+            bucket_last = (offset + last - 1) // bucket_size
+            if bucket_last - bucket_first < buckets_max or bucket_size == self.levels[-1][0]:
+                break
+        positions = numpy.arange(bucket_first, bucket_last + 1) % len(level_times)
+        x = numpy.repeat(level_times[positions], 2)
+        y = numpy.empty(len(x))
+        y[0::2] = minimums[column, positions]
+        y[1::2] = maximums[column, positions]
+        return x, y
+
+    def clear(self):
+        """
+        Remove all samples kept in memory
+        """
+        self.history.clear()
+        self.appended = 0
+
+    def __len__(self):
+        return len(self.history)
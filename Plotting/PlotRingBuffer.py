@@ -0,0 +1,92 @@
+import numpy
+
+
+class PlotRingBuffer:
+    """
+    Class for storing fixed-length history of plotted samples. Every column is kept twice in a row of length
+    2 * capacity, so the newest samples always form one contiguous slice and plots get views without copying
+    """
+    SPILL_CHUNK = 500  # Number of overwritten samples collected before they are appended to spill file
+
+    def __init__(self, columns: int, capacity: int, spill_path: str = None):
+        """
+        Class initialization
+        :param columns: number of values in every sample, e.g. time and values of all plots
+        :param capacity: max number of samples kept in memory
+        :param spill_path: path of CSV file that overwritten samples are appended to, they are discarded if None
+        """
+        if columns <= 0 or capacity <= 0:
+            raise ValueError("Error: Number of columns and capacity must be positive")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.data = numpy.zeros((columns, 2 * capacity))
+        self.head = -1  # Position of newest sample in first half of rows
+        self.count = 0  # Number of samples kept in memory
+        self.spill_pending = []
+
+    def append(self, sample):
+        """
+        Add sample, oldest sample is overwritten when buffer is full
+        :param sample: sequence of values, one for every column
+        """
+        self.head = (self.head + 1) % self.capacity
+        if self.count == self.capacity:
+            self.__spill(self.data[:, self.head].copy())
+        else:
+            self.count += 1
+        self.data[:, self.head] = sample
+        self.data[:, self.head + self.capacity] = sample
+
+    def view(self, column: int) -> numpy.ndarray:
+        """
+        Return samples of column from oldest to newest, array shares memory with buffer and is valid until next append
+        :param column: index of column
+        :return: contiguous read-only view of column
+        """
+        end = self.head + self.capacity + 1
+        view = self.data[column, end - self.count:end]
+        view.flags.writeable = False
+        return view
+
+    def last_interval(self, column: int = 0) -> float:
+        """
+        Return difference of two newest samples of column, e.g. time between samples
+        :param column: index of column
+        :return: difference of values, 0 if there are less than two samples
+        """
+        if self.count < 2:
+            return 0.0
+        end = self.head + self.capacity
+        return self.data[column, end] - self.data[column, end - 1]
+
+    def __spill(self, sample: numpy.ndarray):
+        """
+        Collect overwritten sample and write collected samples to spill file in chunks
+        :param sample: overwritten sample
+        """
+        if self.spill_path is None:
+            return
+        self.spill_pending.append(sample)
+        if len(self.spill_pending) >= self.SPILL_CHUNK:
+            self.flush()
+
+    def flush(self):
+        """
+        Write collected overwritten samples to spill file
+        """
+        if self.spill_path is None or len(self.spill_pending) == 0:
+            return
+        with open(self.spill_path, 'a') as file:
+            numpy.savetxt(file, numpy.array(self.spill_pending), delimiter=',')
+        self.spill_pending = []
+
+    def clear(self):
+        """
+        Remove all samples kept in memory, collected overwritten samples are written to spill file first
+        """
+        self.flush()
+        self.head = -1
+        self.count = 0
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+
+from PyQt5.QtGui import QPixmap
+
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputModes as OutputModes
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputStates as OutputStates
+from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputProtectionStates as OutputProtectionStates
+
+
+@dataclass(frozen=True)
+class RigolDP832ChannelWidgets:
+    """
+    Class for storing widgets showing single channel of Rigol DP832
+    """
+    voltage_measure: object  # QPushButton with measured voltage, toggles voltage plot
+    current_measure: object  # QPushButton with measured current, toggles current plot
+    power_measure: object  # QPushButton with measured power
+    state: object  # QPushButton toggling output
+    ovp_state: object  # QPushButton toggling OVP
+    ocp_state: object  # QPushButton toggling OCP
+    led: object  # QLabel with CV/CC LED pixmap
+    mode: object  # QLabel with CV/CC text
+
+
+class RigolDP832ViewModel:
+    """
+    Class for rendering Rigol DP832 state to widgets. Last rendered text, stylesheet and pixmap of every widget
+    is kept and widget is touched only when they change, pixmaps and stylesheets are created once
+    """
+    VOLTAGE_FORMAT = '{:6.3f} V'  # Fixed width, DP832 resolution is 1 mV up to 30 V
+    CURRENT_FORMAT = '{:5.3f} A'  # Fixed width, DP832 resolution is 1 mA up to 3 A
+    POWER_FORMAT = '{:6.3f} W'  # Fixed width, up to 90 W
+
+    STATE_ENABLED_STYLESHEET = 'background-color: rgb(85, 170, 127);\nborder-radius: 10px;\npadding: 10px; font: 75 11pt'
+    STATE_DISABLED_STYLESHEET = 'background-color: #1f1d2c;\nborder-radius: 10px;\npadding: 10px; font: 75 11pt'
+    BUTTON_ENABLED_STYLESHEET = 'background-color: rgb(85, 170, 127);\nborder-radius: 10px;\npadding: 5px; font: 75 9pt'
+    BUTTON_DISABLED_STYLESHEET = 'background-color: #1f1d2c;\nborder-radius: 10px;\npadding: 5px; font: 75 9pt'
+    MEASURE_STYLESHEET = 'border : 3px solid #1f1d2c;\ncolor: rgb(250, 250, 250);\nbackground-color: #262837;\n' \
+                         'border-radius: 5px;\npadding: 1px;'
+    MEASURE_PLOTTED_STYLESHEET = 'border : 3px solid #1f1d2c;\ncolor: rgb(250, 250, 250);\nbackground-color: #262837;\n' \
+                                 'border-radius: 5px;\nborder-color: {};\npadding: 1px;'
+
+    def __init__(self, channels: [RigolDP832ChannelWidgets], led_enabled_path: str, led_disabled_path: str,
+                 voltage_plot_colors: [str], current_plot_colors: [str]):
+        """
+        Class initialization
+        :param channels: widgets of all channels, index 0 holds first channel
+        :param led_enabled_path: path of LED image shown in CC mode
+        :param led_disabled_path: path of LED image shown in CV mode
+        :param voltage_plot_colors: border colors of voltage buttons with plot enabled, one for every channel
+        :param current_plot_colors: border colors of current buttons with plot enabled, one for every channel
+        """
+        self.channels = channels
+        self.mode_pixmaps = {OutputModes.CONSTANT_VOLTAGE: QPixmap(led_disabled_path),
+                             OutputModes.CONSTANT_CURRENT: QPixmap(led_enabled_path)}
+        self.voltage_plotted_stylesheets = [self.MEASURE_PLOTTED_STYLESHEET.format(color)
+                                            for color in voltage_plot_colors]
+        self.current_plotted_stylesheets = [self.MEASURE_PLOTTED_STYLESHEET.format(color)
+                                            for color in current_plot_colors]
+        self.rendered = {}  # (widget, property): last rendered value
+
+    def __render(self, widget, name: str, value, setter):
+        """
+        Pass value to widget setter if it differs from last rendered value
+        :param widget: rendered widget
+        :param name: name of rendered property
+        :param value: new value of property
+        :param setter: widget method setting property
+        """
+        key = (widget, name)
+        if key in self.rendered and self.rendered[key] == value:
+            return
+        setter(value)
+        self.rendered[key] = value
+
+    def text_render(self, widget, text: str):
+        """
+        Set text of widget if it changed
+        :param widget: QPushButton or QLabel
+        :param text: new text
+        """
+        self.__render(widget, 'text', text, widget.setText)
+
+    def stylesheet_render(self, widget, stylesheet: str):
+        """
+        Set stylesheet of widget if it changed
+        :param widget: any QWidget
+        :param stylesheet: new stylesheet
+        """
+        self.__render(widget, 'stylesheet', stylesheet, widget.setStyleSheet)
+
+    def pixmap_render(self, widget, pixmap: QPixmap):
+        """
+        Set pixmap of widget if it changed, pixmaps are compared by identity
+        :param widget: QLabel
+        :param pixmap: new preloaded pixmap
+        """
+        self.__render(widget, 'pixmap', pixmap, widget.setPixmap)
+
+    def measurement_render(self, measurement):
+        """
+        Show measured values of all channels
+        :param measurement: RigolDP832Measurement of all channels
+        """
+        for i, widgets in enumerate(self.channels):
+            self.text_render(widgets.voltage_measure, self.VOLTAGE_FORMAT.format(measurement.voltage[i]))
+            self.text_render(widgets.current_measure, self.CURRENT_FORMAT.format(measurement.current[i]))
+            self.text_render(widgets.power_measure, self.POWER_FORMAT.format(measurement.power[i]))
+
+    def modes_render(self, modes: tuple):
+        """
+        Show output mode of all channels, unregulated channels are shown as CC
+        :param modes: RigolDP832OutputModes of all channels, index 0 holds first channel
+        """
+        for widgets, mode in zip(self.channels, modes):
+            if mode != OutputModes.CONSTANT_VOLTAGE:
+                mode = OutputModes.CONSTANT_CURRENT
+            self.pixmap_render(widgets.led, self.mode_pixmaps[mode])
+            self.text_render(widgets.mode, mode.value)
+
+    def output_render(self, channel: int, enabled: bool):
+        """
+        Show output state of channel
+        :param channel: specific channel to interact with, 0 is first channel
+        :param enabled: True if output is turned ON
+        """
+        widget = self.channels[channel].state
+        self.stylesheet_render(widget, self.STATE_ENABLED_STYLESHEET if enabled else self.STATE_DISABLED_STYLESHEET)
+        self.text_render(widget, OutputStates.ON.value if enabled else OutputStates.OFF.value)
+
+    def ovp_render(self, channel: int, enabled: bool):
+        """
+        Show OVP state of channel
+        :param channel: specific channel to interact with, 0 is first channel
+        :param enabled: True if OVP is turned ON
+        """
+        self.__protection_render(self.channels[channel].ovp_state, enabled)
+
+    def ocp_render(self, channel: int, enabled: bool):
+        """
+        Show OCP state of channel
+        :param channel: specific channel to interact with, 0 is first channel
+        :param enabled: True if OCP is turned ON
+        """
+        self.__protection_render(self.channels[channel].ocp_state, enabled)
+
+    def __protection_render(self, widget, enabled: bool):
+        """
+        Show OVP or OCP state
+        :param widget: QPushButton toggling protection
+        :param enabled: True if protection is turned ON
+        """
+        self.stylesheet_render(widget, self.BUTTON_ENABLED_STYLESHEET if enabled else self.BUTTON_DISABLED_STYLESHEET)
+        self.text_render(widget, OutputProtectionStates.ON.value if enabled else OutputProtectionStates.OFF.value)
+
+    def voltage_plot_render(self, channel: int, plotted: bool):
+        """
+        Show if voltage of channel is plotted
+        :param channel: specific channel to interact with, 0 is first channel
+        :param plotted: True if voltage plot is enabled
+        """
+        self.stylesheet_render(self.channels[channel].voltage_measure,
+                               self.voltage_plotted_stylesheets[channel] if plotted else self.MEASURE_STYLESHEET)
+
+    def current_plot_render(self, channel: int, plotted: bool):
+        """
+        Show if current of channel is plotted
+        :param channel: specific channel to interact with, 0 is first channel
+        :param plotted: True if current plot is enabled
+        """
+        self.stylesheet_render(self.channels[channel].current_measure,
+                               self.current_plotted_stylesheets[channel] if plotted else self.MEASURE_STYLESHEET)
@@ -1,14 +1,12 @@
 import qdarkstyle as qdarkstyle
-import webbrowser
 import logging
 import sys
 
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QIcon, QPixmap
-from DriverThreads.RigolDP832Thread import RigolDP832Thread
-from Drivers.RigolDP832.RIGOL832 import OutputProtectionStates, OutputModes, OutputStates, RigolDP832
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer, QMetaObject, Qt
+from PyQt5.QtGui import QIcon
+from Diagnostics.EventLoopWatchdog import EventLoopWatchdog
 from ui_files.ui_lab_equipment_controler import Ui_MainWindow
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QPushButton
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QPushButton, QComboBox, QVBoxLayout
 
 
 class MainWindow(QMainWindow):
@@ -22,18 +20,22 @@ class MainWindow(QMainWindow):
     output_current_changed = pyqtSignal(int, float)
     ovp_value_changed = pyqtSignal(int, float)
     ocp_value_changed = pyqtSignal(int, float)
+    rigoldp832_connected = pyqtSignal(str, object)  # Signal used to pass address and finished connection future to GUI thread
+    plotted_channels_changed = pyqtSignal(object)  # Signal used to pass set of plotted channels to polling scheduler
 
     LED_DISABLED_PATH = './Images/led_disabled.png'
     LED_ENABLED_PATH = './Images/led_enabled.png'
     THE_HEART_LOGO_PATH = 'Images/the_heart_logo_dark_small.png'
-    BUTTON_ENABLED_STYLESHEET = 'background-color: rgb(85, 170, 127);\nborder-radius: 10px;\npadding: 5px; font: 75 9pt'
-    BUTTON_DISABLED_STYLESHEET = 'background-color: #1f1d2c;\nborder-radius: 10px;\npadding: 5px; font: 75 9pt'
 
     RIGOL_DP832_CHANNELS_QUANTITY = 3
+    RIGOL_DP832_ADDRESSES = ['USB0::0x1AB1::0x0E11::DP8C193604338::INSTR']  # Every power supply gets its own worker
     PLOT_LENGTH_THRESHOLD = 28
-    SET_TIMER_INTERVAL = 300  # Time in [ms]
-    PLOT_INTERVAL = 200  # Time in [ms]
+    PLOT_REFRESH_RATE_DEFAULT = 60  # Plot redraw rate in [Hz] used if screen does not report its refresh rate
+    PLOT_HISTORY_LENGTH = 9000  # Number of samples kept for plots, 15 minutes at fastest polling rate
+    PLOT_HISTORY_SPILL_PATH = None  # CSV file that samples older than plot history are appended to, None discards them
+    PLOT_TIME_COLUMN = 0  # Column of plot history holding sample time
     RIGOL_DP832_TAB_INDEX = 1
+    EVENT_LOOP_BLOCK_THRESHOLD = 0.2  # Time in [s] of blocked GUI event loop that is logged
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -65,50 +67,129 @@ class MainWindow(QMainWindow):
         self.ui.settings_check_Siglent_SDG2122X.triggered.connect(lambda: self.tab_checkbox_state_changed(self.ui.tabWidget.indexOf(self.ui.tab_Siglent)))
         self.ui.actionOpen_Controller_Repository.triggered.connect(self.open_repo_controller)
         self.ui.actionOpen_Drivers_Repository.triggered.connect(self.open_repo_drivers)
+        self.rigoldp832_connected.connect(self.rigoldp832_connection_finished)
+        self.rigoldp832_threads = {}  # Address: QThread of Rigol DP832 worker
+        self.rigoldp832_workers = {}  # Address: RigolDP832Thread
+        self.RigolDp832Thread = None  # Worker of power supply shown in tab
+        self.rigoldp832_plot = None  # PlotWidget created when tab is shown first time
+        self.rigoldp832_device_combobox = None
+        self.ui.tabWidget.currentChanged.connect(self.tab_current_changed)
         self.init_tabs()
+        self.event_loop_watchdog = EventLoopWatchdog(self.EVENT_LOOP_BLOCK_THRESHOLD, self)
+        self.event_loop_watchdog.start()
 
     def init_rigoldp832(self):
-        self.rigoldp832_address = 'USB0::0x1AB1::0x0E11::DP8C193604338::INSTR'
-        self.rigolThread = QThread()
-        self.RigolDp832Thread = RigolDP832Thread(self.RIGOL_DP832_CHANNELS_QUANTITY, self.rigoldp832_address)
-        self.RigolDp832Thread.moveToThread(self.rigolThread)
-
-        if self.RIGOL_DP832_CHANNELS_QUANTITY != self.RigolDp832Thread.Rigol.CHANNEL_MAX:
+        """
+        Start connecting to all Rigol DP832 power supplies and reading their state in background,
+        tab is enabled when first connection is done. Driver stack (pyvisa) is imported here, not on application start
+        """
+        from Drivers.VisaConnectionPool import VisaConnectionPool
+        from DriverThreads.RigolDP832Thread import RigolDP832Thread
+        if len(self.rigoldp832_workers) == 0:
+            self.ui.tab_RigolDp832.setEnabled(False)
+        for address in self.RIGOL_DP832_ADDRESSES:
+            if address not in self.rigoldp832_workers:
+                future = VisaConnectionPool.run_async(RigolDP832Thread.snapshot_read, address)
+                future.add_done_callback(lambda done, address=address: self.rigoldp832_connected.emit(address, done))
+
+    def rigoldp832_connection_finished(self, address: str, future):
+        """
+        Finish Rigol DP832 initialization when background connection is done
+        :param address: address of connected power supply
+        :param future: finished connection future resolved with RigolDP832Snapshot
+        """
+        try:
+            self.rigoldp832_device_add(address, future.result())
+        except Exception as error:  # any failure of background connection is reported, not only VISA errors
+            logging.exception(f"Rigol DP832 {address}: connection failed")
+            self.open_connection_error_messagebox(self.RIGOL_DP832_TAB_INDEX, f"{address}: {error}")
+            return
+        self.ui.tab_RigolDp832.setEnabled(True)
+
+    def rigoldp832_device_add(self, address: str, snapshot: 'RigolDP832Snapshot' = None):
+        """
+        Start worker thread of connected Rigol DP832, first connected power supply is shown in tab
+        :param address: address of connected power supply
+        :param snapshot: state of power supply read in background, worker reads it if None
+        """
+        from DriverThreads.RigolDP832Thread import RigolDP832Thread
+        if address in self.rigoldp832_workers:
+            return
+        thread = QThread()
+        worker = RigolDP832Thread(self.RIGOL_DP832_CHANNELS_QUANTITY, address, snapshot)
+        worker.moveToThread(thread)
+        if self.RIGOL_DP832_CHANNELS_QUANTITY != worker.Rigol.CHANNEL_MAX:
             raise ValueError("Invalid number of channels!")
+        thread.start()
+        self.rigoldp832_threads[address] = thread
+        self.rigoldp832_workers[address] = worker
+
+        if self.RigolDp832Thread is None:
+            self.init_rigoldp832_controls(worker)
+        self.rigoldp832_device_combobox.addItem(address)
+
+    def rigoldp832_device_select(self, address: str):
+        """
+        Show power supply in tab, UI controls are connected to its worker
+        :param address: address of power supply
+        """
+        worker = self.rigoldp832_workers.get(address)
+        if worker is None or worker is self.RigolDp832Thread:
+            return
+        if self.RigolDp832Thread is not None:
+            self.plotted_channels_changed.emit(set())  # stop polling plotted channels of hidden power supply
+            self.rigoldp832_worker_signals_connect(self.RigolDp832Thread, False)
+        self.RigolDp832Thread = worker
+        self.rigoldp832_worker_signals_connect(worker, True)
+
+        snapshot = worker.cached_snapshot()
+        self.rigoldp832_measurement = worker.measurement
+        self.channels_voltage = [state.voltage_set for state in snapshot.channels]
+        self.channels_current = [state.current_set for state in snapshot.channels]
+        spinboxes = self.voltage_spinboxes + self.current_spinboxes + self.ovp_spinboxes + self.ocp_spinboxes
+        for box in spinboxes:
+            box.blockSignals(True)  # values are read from power supply, there is nothing to write back
+        self.init_rigol_ui()
+        for box in spinboxes:
+            box.blockSignals(False)
+
+        self.plot_pyramid.clear()
+        self.plot_x_range_reset()
+        self.plotted_channels_emit()
+
+    def rigoldp832_worker_signals_connect(self, worker: 'RigolDP832Thread', connect: bool):
+        """
+        Connect or disconnect UI signals with Rigol DP832 worker
+        :param worker: worker of power supply
+        :param connect: True to connect signals, False to disconnect them
+        """
+        connections = [(self.toggle_channel, worker.channel_toggle),
+                       (self.toggle_ovp, worker.ovp_toggle),
+                       (self.toggle_ocp, worker.ocp_toggle),
+                       (self.ovp_value_changed, worker.ovp_value_changed),
+                       (self.ocp_value_changed, worker.ocp_value_changed),
+                       (self.output_voltage_changed, worker.voltage_value_changed),
+                       (self.output_current_changed, worker.current_value_changed),
+                       (self.plotted_channels_changed, worker.plotted_channels_changed),
+                       (worker.measure_values_signal, self.overwrite_measured_values),
+                       (worker.mode_read_signal, self.cvcc_led_refresh)]
+        for signal, slot in connections:
+            if connect:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
 
-        self.toggle_channel.connect(self.RigolDp832Thread.channel_toggle)
-        self.toggle_ovp.connect(self.RigolDp832Thread.ovp_toggle)
-        self.toggle_ocp.connect(self.RigolDp832Thread.ocp_toggle)
-        self.ovp_value_changed.connect(self.RigolDp832Thread.ovp_value_changed)
-        self.ocp_value_changed.connect(self.RigolDp832Thread.ocp_value_changed)
-        self.output_voltage_changed.connect(self.RigolDp832Thread.voltage_value_changed)
-        self.output_current_changed.connect(self.RigolDp832Thread.current_value_changed)
-        self.RigolDp832Thread.measure_values_signal.connect(self.overwrite_measured_values)
-        self.RigolDp832Thread.mode_read_signal.connect(self.cvcc_led_refresh)
-        self.rigolThread.start()
-
-        self.set_timer_1 = QTimer(self)
-        self.set_timer_1.setInterval(self.SET_TIMER_INTERVAL)
-        self.set_timer_1.timeout.connect(lambda: self.voltage_spinbox_value_changed(RigolDP832.CHANNEL_FIRST - 1))
-        self.set_timer_2 = QTimer(self)
-        self.set_timer_2.setInterval(self.SET_TIMER_INTERVAL)
-        self.set_timer_2.timeout.connect(lambda: self.voltage_spinbox_value_changed(RigolDP832.CHANNEL_SECOND - 1))
-        self.set_timer_3 = QTimer(self)
-        self.set_timer_3.setInterval(self.SET_TIMER_INTERVAL)
-        self.set_timer_3.timeout.connect(lambda: self.voltage_spinbox_value_changed(RigolDP832.CHANNEL_THIRD - 1))
-        self.set_timers = [self.set_timer_1,
-                           self.set_timer_2,
-                           self.set_timer_3]
-
-        self.channels_voltage = [self.RigolDp832Thread.channels_voltage_set_value[RigolDP832.CHANNEL_FIRST - 1],
-                                 self.RigolDp832Thread.channels_voltage_set_value[RigolDP832.CHANNEL_SECOND - 1],
-                                 self.RigolDp832Thread.channels_voltage_set_value[RigolDP832.CHANNEL_THIRD - 1]]
+    def init_rigoldp832_controls(self, worker: 'RigolDP832Thread'):
+        """
+        Rigol DP832 UI controls initialization, called when first power supply is connected
+        :param worker: worker of power supply shown in tab
+        """
+        from Plotting.PlotRingBuffer import PlotRingBuffer
+        from Plotting.PlotMinMaxPyramid import PlotMinMaxPyramid
+        from ViewModels.RigolDP832ViewModel import RigolDP832ViewModel, RigolDP832ChannelWidgets
         self.voltage_spinboxes = [self.ui.doubleSpinBox_voltage_channel_1,
                                   self.ui.doubleSpinBox_voltage_channel_2,
                                   self.ui.doubleSpinBox_voltage_channel_3]
-        self.channels_current = [self.RigolDp832Thread.channels_current_set_value[RigolDP832.CHANNEL_FIRST - 1],
-                                 self.RigolDp832Thread.channels_current_set_value[RigolDP832.CHANNEL_SECOND - 1],
-                                 self.RigolDp832Thread.channels_current_set_value[RigolDP832.CHANNEL_THIRD - 1]]
         self.current_spinboxes = [self.ui.doubleSpinBox_current_channel_1,
                                   self.ui.doubleSpinBox_current_channel_2,
                                   self.ui.doubleSpinBox_current_channel_3]
@@ -125,8 +206,8 @@ class MainWindow(QMainWindow):
                                             self.ui.pushButton_current_measured_values_2,
                                             self.ui.pushButton_current_measured_values_3]
         self.power_measure_pushbuttons = [self.ui.pushButton_power_measured_values_1,
-                                          self.ui.pushButton_power_measured_values_1,
-                                          self.ui.pushButton_power_measured_values_1]
+                                          self.ui.pushButton_power_measured_values_2,
+                                          self.ui.pushButton_power_measured_values_3]
 
         self.channels_state = [False] * self.RIGOL_DP832_CHANNELS_QUANTITY
         self.channels_ovp_state = [False] * self.RIGOL_DP832_CHANNELS_QUANTITY
@@ -146,10 +227,9 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_ocp_channel_2.clicked.connect(lambda: self.channel_toggle_ocp_button_clicked(1))
         self.ui.pushButton_ocp_channel_3.clicked.connect(lambda: self.channel_toggle_ocp_button_clicked(2))
 
-        self.init_rigol_ui()
-        self.ui.doubleSpinBox_voltage_channel_1.valueChanged.connect(self.set_timer_1.start)
-        self.ui.doubleSpinBox_voltage_channel_2.valueChanged.connect(self.set_timer_2.start)
-        self.ui.doubleSpinBox_voltage_channel_3.valueChanged.connect(self.set_timer_3.start)
+        self.ui.doubleSpinBox_voltage_channel_1.valueChanged.connect(lambda: self.voltage_spinbox_value_changed(0))
+        self.ui.doubleSpinBox_voltage_channel_2.valueChanged.connect(lambda: self.voltage_spinbox_value_changed(1))
+        self.ui.doubleSpinBox_voltage_channel_3.valueChanged.connect(lambda: self.voltage_spinbox_value_changed(2))
         self.ui.doubleSpinBox_current_channel_1.valueChanged.connect(lambda: self.current_spinbox_value_changed(0))
         self.ui.doubleSpinBox_current_channel_2.valueChanged.connect(lambda: self.current_spinbox_value_changed(1))
         self.ui.doubleSpinBox_current_channel_3.valueChanged.connect(lambda: self.current_spinbox_value_changed(2))
@@ -159,22 +239,14 @@ class MainWindow(QMainWindow):
         self.ui.doubleSpinBox_ocp_channel_1.valueChanged.connect(lambda: self.ocp_spinbox_value_changed(0))
         self.ui.doubleSpinBox_ocp_channel_2.valueChanged.connect(lambda: self.ocp_spinbox_value_changed(1))
         self.ui.doubleSpinBox_ocp_channel_3.valueChanged.connect(lambda: self.ocp_spinbox_value_changed(2))
-        self.ui.graphicsView.setLimits(yMin=-1, yMax=31)
-        self.x_min_value = 2
-        self.x_max_value = 28
-        self.plot_time = 0
-        self.plot_length = 0
-        self.ui.graphicsView.setXRange(self.x_min_value, self.x_max_value)
-        self.ui.graphicsView.setYRange(0, 30)
-        self.channel_1_plot_voltage_values = []
-        self.channel_2_plot_voltage_values = []
-        self.channel_3_plot_voltage_values = []
-        self.channel_1_plot_current_values = []
-        self.channel_2_plot_current_values = []
-        self.channel_3_plot_current_values = []
-        self.plot_time_array = []
-        self.plots_voltage_values_arrays = [self.channel_1_plot_voltage_values, self.channel_2_plot_voltage_values, self.channel_3_plot_voltage_values]
-        self.plots_current_values_arrays = [self.channel_1_plot_current_values, self.channel_2_plot_current_values, self.channel_3_plot_current_values]
+        self.init_rigoldp832_tab()
+        self.plot_x_range_reset()
+        # Plot history columns: time, voltage of every channel, current of every channel
+        self.plot_history = PlotRingBuffer(1 + 2 * self.RIGOL_DP832_CHANNELS_QUANTITY, self.PLOT_HISTORY_LENGTH,
+                                           self.PLOT_HISTORY_SPILL_PATH)
+        self.plot_pyramid = PlotMinMaxPyramid(self.plot_history, self.PLOT_TIME_COLUMN)
+        self.plots_voltage_columns = [1 + i for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY)]
+        self.plots_current_columns = [1 + self.RIGOL_DP832_CHANNELS_QUANTITY + i for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY)]
         self.ui.pushButton_voltage_measured_values_1.clicked.connect(lambda: self.toggle_voltage_plot(0))
         self.ui.pushButton_voltage_measured_values_2.clicked.connect(lambda: self.toggle_voltage_plot(1))
         self.ui.pushButton_voltage_measured_values_3.clicked.connect(lambda: self.toggle_voltage_plot(2))
@@ -185,12 +257,83 @@ class MainWindow(QMainWindow):
         self.plots_current_enabled = [False] * self.RIGOL_DP832_CHANNELS_QUANTITY
         self.plot_border_colors = ['red', 'green', 'blue', 'cyan', 'magenta', 'yellow']
         self.plot_pens_colors = ['r', 'g', 'b', 'c', 'm', 'y']
-
-        self.plot_interval_value = self.PLOT_INTERVAL  # Time in [ms]
+        channels_widgets = [RigolDP832ChannelWidgets(*widgets) for widgets in
+                            zip(self.voltage_measure_pushbuttons, self.current_measure_pushbuttons,
+                                self.power_measure_pushbuttons, self.channels_state_buttons,
+                                self.channels_ovp_state_buttons, self.channels_ocp_state_buttons,
+                                self.channels_led, self.channels_cvcc_labels)]
+        self.rigoldp832_view = RigolDP832ViewModel(channels_widgets, self.LED_ENABLED_PATH, self.LED_DISABLED_PATH,
+                                                   self.plot_border_colors[:self.RIGOL_DP832_CHANNELS_QUANTITY],
+                                                   self.plot_border_colors[self.RIGOL_DP832_CHANNELS_QUANTITY:])
+        # Curves are created once and updated with setData, dense history is decimated to screen resolution
+        # by plot_pyramid
+        self.plots_voltage_curves = [self.plot_curve_create(self.plot_pens_colors[i], f"Channel {i+1} Voltage")
+                                     for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY)]
+        self.plots_current_curves = [self.plot_curve_create(self.plot_pens_colors[3+i], f"Channel {i+1} Current")
+                                     for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY)]
+        self.rigoldp832_device_select(worker.address)
+
+        # Plot is redrawn once per screen frame after new measurement arrived, measurements arriving
+        # in the same frame are drawn together
+        refresh_rate = QApplication.primaryScreen().refreshRate() or self.PLOT_REFRESH_RATE_DEFAULT
+        self.plot_interval_value = int(1000 / refresh_rate)  # Time in [ms]
         self.plot_timer = QTimer(self)
+        self.plot_timer.setSingleShot(True)
         self.plot_timer.setInterval(self.plot_interval_value)
         self.plot_timer.timeout.connect(self.draw_plot)
-        self.plot_timer.start()
+
+    def plot_curve_create(self, pen: str, name: str):
+        """
+        Create hidden curve in graph
+        :param pen: color of curve
+        :param name: name of curve
+        :return: created PlotDataItem
+        """
+        curve = self.rigoldp832_plot.plot([], [], pen=pen, name=name)
+        curve.setVisible(False)
+        return curve
+
+    def closeEvent(self, event):
+        """
+        Stop device workers and their threads, write plot history collected for spill file and stop event loop
+        watchdog before window is closed
+        """
+        for address, thread in self.rigoldp832_threads.items():
+            # worker finishes running transaction first, its timers can be stopped only from its own thread
+            QMetaObject.invokeMethod(self.rigoldp832_workers[address], 'stop', Qt.BlockingQueuedConnection)
+            thread.quit()
+            thread.wait()
+        self.event_loop_watchdog.stop()
+        if hasattr(self, 'plot_history'):
+            self.plot_history.flush()
+        super(MainWindow, self).closeEvent(event)
+
+    def tab_current_changed(self, index: int):
+        """
+        Build content of device tab when it is shown first time
+        :param index: index of current tab
+        """
+        if self.ui.tabWidget.widget(index) is self.ui.tab_RigolDp832:
+            self.init_rigoldp832_tab()
+
+    def init_rigoldp832_tab(self):
+        """
+        Build Rigol DP832 plot and device selector, pyqtgraph is imported here, not on application start
+        """
+        if self.rigoldp832_plot is not None:
+            return
+        from pyqtgraph import PlotWidget
+        self.rigoldp832_plot = PlotWidget(self.ui.widget_plot_container)
+        layout = QVBoxLayout(self.ui.widget_plot_container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.rigoldp832_plot)
+        self.rigoldp832_plot.setLimits(yMin=-1, yMax=31)
+        self.rigoldp832_plot.setYRange(0, 30)
+        self.rigoldp832_plot.setClipToView(True)  # points outside view are skipped
+        self.rigoldp832_device_combobox = QComboBox(self.ui.tab_RigolDp832)
+        self.rigoldp832_device_combobox.setGeometry(30, 610, 400, 25)
+        self.rigoldp832_device_combobox.setVisible(len(self.RIGOL_DP832_ADDRESSES) > 1)
+        self.rigoldp832_device_combobox.currentTextChanged.connect(self.rigoldp832_device_select)
 
     def init_tabs(self):
         """
@@ -200,10 +343,11 @@ class MainWindow(QMainWindow):
             if not tab.isChecked():
                 self.ui.tabWidget.setTabVisible(index+1, False)
 
-    def open_connection_error_messagebox(self, index: int):
+    def open_connection_error_messagebox(self, index: int, details: str = None):
         """
         Open connection error QMessageBox if application can't connect to selected device
         :param index: index of device tab
+        :param details: description of error shown in details of message box, hidden if None
         """
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Warning)
@@ -211,6 +355,8 @@ class MainWindow(QMainWindow):
         msg.setText("Can't connect to device")
         msg.setInformativeText("Make sure device is connected and try again")
         msg.setWindowTitle("Connection Error")
+        if details is not None:
+            msg.setDetailedText(details)
         msg.setStandardButtons(QMessageBox.Ok | QMessageBox.Close)
         buttonY = msg.button(QMessageBox.Ok)
         buttonY.setText('Reconnect')
@@ -227,11 +373,7 @@ class MainWindow(QMainWindow):
         """
         if self.settings_tab_checkable[index-1].isChecked():
             if index == self.RIGOL_DP832_TAB_INDEX:
-                try:
-                    self.init_rigoldp832()
-                except ConnectionError:
-                    self.open_connection_error_messagebox(index)
-                    raise ConnectionError(f"Can't connect to device")
+                self.init_rigoldp832()
             self.ui.tabWidget.setTabVisible(index, True)
         else:
             self.ui.tabWidget.setTabVisible(index, False)
@@ -246,6 +388,7 @@ class MainWindow(QMainWindow):
         """
         Open device controller repository in web browser
         """
+        import webbrowser
         webbrowser.open('https://gitlab.rndlab.online/embedded/others/lab-equipment-control')
 
     @staticmethod
@@ -253,6 +396,7 @@ class MainWindow(QMainWindow):
         """
         Open drivers repository in web browser
         """
+        import webbrowser
         webbrowser.open('https://gitlab.rndlab.online/embedded/drivers/lab-equipment-drivers')
 
     def toggle_voltage_plot(self, channel: int):
@@ -260,116 +404,123 @@ class MainWindow(QMainWindow):
         Toggle visibility of voltage plot in [V] in graph
         :param channel: specific channel to interact with
         """
-        if self.plots_voltage_enabled[channel] is True:
-            self.plots_voltage_enabled[channel] = False
-            self.voltage_measure_pushbuttons[channel].setStyleSheet("border : 3px solid #1f1d2c;\
-                                                                    color: rgb(250, 250, 250);\
-                                                                    background-color: #262837;\
-                                                                    border-radius: 5px;\
-                                                                    padding: 1px;")
-        else:
-            self.plots_voltage_enabled[channel] = True
-            self.voltage_measure_pushbuttons[channel].setStyleSheet(f"border : 3px solid #1f1d2c;\
-                                                                    color: rgb(250, 250, 250);\
-                                                                    background-color: #262837;\
-                                                                    border-radius: 5px;\
-                                                                    border-color: {self.plot_border_colors[channel]};\
-                                                                    padding: 1px;")
+        self.plots_voltage_enabled[channel] = not self.plots_voltage_enabled[channel]
+        self.plots_voltage_curves[channel].setVisible(self.plots_voltage_enabled[channel])
+        self.rigoldp832_view.voltage_plot_render(channel, self.plots_voltage_enabled[channel])
+        self.plotted_channels_emit()
 
     def toggle_current_plot(self, channel: int):
         """
         Toggle visibility of current plot in [A] in graph
         :param channel: specific channel to interact with
         """
-        if self.plots_current_enabled[channel] is True:
-            self.plots_current_enabled[channel] = False
-            self.current_measure_pushbuttons[channel].setStyleSheet("border : 3px solid #1f1d2c;\
-                                                                    color: rgb(250, 250, 250);\
-                                                                    background-color: #262837;\
-                                                                    border-radius: 5px;\
-                                                                    padding: 1px;")
-        else:
-            self.plots_current_enabled[channel] = True
-            self.current_measure_pushbuttons[channel].setStyleSheet(f"border : 3px solid #1f1d2c;\
-                                                                    color: rgb(250, 250, 250);\
-                                                                    background-color: #262837;\
-                                                                    border-radius: 5px;\
-                                                                    border-color: {self.plot_border_colors[3+channel]};\
-                                                                    padding: 1px;")
+        self.plots_current_enabled[channel] = not self.plots_current_enabled[channel]
+        self.plots_current_curves[channel].setVisible(self.plots_current_enabled[channel])
+        self.rigoldp832_view.current_plot_render(channel, self.plots_current_enabled[channel])
+        self.plotted_channels_emit()
+
+    def plotted_channels_emit(self):
+        """
+        Send channels with voltage or current plot enabled to Rigol DP832 thread, so they are polled
+        """
+        channels = {i+1 for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY)
+                    if self.plots_voltage_enabled[i] or self.plots_current_enabled[i]}
+        self.plotted_channels_changed.emit(channels)
+
+    def plot_measurement_append(self, measurement):
+        """
+        Add measurement to plot history and schedule plot redraw, measurement already stored is skipped
+        :param measurement: RigolDP832Measurement of all channels
+        """
+        if len(self.plot_history) > 0 and \
+                measurement.timestamp <= self.plot_history.view(self.PLOT_TIME_COLUMN)[-1]:
+            return
+        # Measurement row starts with time, voltages and currents, same layout as sample of plot history
+        self.plot_pyramid.append(measurement.row[:self.plot_history.data.shape[0]])
+        if not self.plot_timer.isActive():
+            self.plot_timer.start()
+
+    def plot_x_range_reset(self):
+        """
+        Show start of time axis, used when plot history is cleared
+        """
+        self.x_min_value = 2
+        self.x_max_value = 28
+        self.rigoldp832_plot.setXRange(self.x_min_value, self.x_max_value)
 
     def draw_plot(self):
         """
-        Draw all selected plots in graph
+        Update data of all selected plots in graph
         """
-        self.ui.graphicsView.clear()
-        self.plot_time_array.append(self.RigolDp832Thread.timestamp)
-        self.plot_length += self.plot_time_array[len(self.plot_time_array)-1] - self.plot_time_array[len(self.plot_time_array)-2]
+        if len(self.plot_history) == 0:
+            return
+        newest_time = self.plot_history.view(self.PLOT_TIME_COLUMN)[-1]  # Right edge follows newest sample
+        if newest_time > self.PLOT_LENGTH_THRESHOLD and newest_time > self.x_max_value:
+            value = newest_time - self.x_max_value
+            self.x_min_value += value
+            self.x_max_value += value
+            self.rigoldp832_plot.setXRange(self.x_min_value - 2, self.x_max_value + 2)
+
+        time_start, time_end = self.rigoldp832_plot.viewRange()[0]
+        buckets_max = max(int(self.rigoldp832_plot.getViewBox().width()), 1)  # Width of plot in pixels
         for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY):
-            voltage = self.RigolDp832Thread.channels_voltage[i]
-            self.plots_voltage_values_arrays[i].append(voltage)
             if self.plots_voltage_enabled[i] is True:
-                x = self.plot_time_array
-                y = self.plots_voltage_values_arrays[i]
-                self.ui.graphicsView.plot(x, y, pen=self.plot_pens_colors[i], name=f"Channel {i+1} Voltage")
+                self.plots_voltage_curves[i].setData(*self.plot_pyramid.window(self.plots_voltage_columns[i],
+                                                                               time_start, time_end, buckets_max))
 
-            current = self.RigolDp832Thread.channels_current[i]
-            self.plots_current_values_arrays[i].append(current)
             if self.plots_current_enabled[i] is True:
-                x = self.plot_time_array
-                y = self.plots_current_values_arrays[i]
-                self.ui.graphicsView.plot(x, y, pen=self.plot_pens_colors[3+i], name=f"Channel {i+1} Voltage")
-
-        if self.plot_length > self.PLOT_LENGTH_THRESHOLD:
-            value = self.plot_time_array[len(self.plot_time_array)-1] - self.plot_time_array[len(self.plot_time_array)-2]
-            self.x_min_value += value
-            self.x_max_value += value
-            self.ui.graphicsView.setXRange(self.x_min_value - 2, self.x_max_value + 2)
+                self.plots_current_curves[i].setData(*self.plot_pyramid.window(self.plots_current_columns[i],
+                                                                               time_start, time_end, buckets_max))
 
     def init_rigol_ui(self):
         """
         Rigol DP832 UI elements initialization
         """
-        self.cvcc_led_refresh()
+        from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputStates as OutputStates
+        from Drivers.RigolDP832.RIGOL832 import RigolDP832OutputProtectionStates as OutputProtectionStates
+        snapshot = self.RigolDp832Thread.cached_snapshot()
+        self.cvcc_led_refresh(snapshot.modes)
 
+        # Settings not read from power supply yet are None, spinboxes keep their values until cache is refreshed
         for index, box in enumerate(self.voltage_spinboxes):
-            box.setValue(self.channels_voltage[index])
+            if self.channels_voltage[index] is not None:
+                box.setValue(self.channels_voltage[index])
 
         for index, box in enumerate(self.current_spinboxes):
-            box.setValue(self.channels_current[index])
+            if self.channels_current[index] is not None:
+                box.setValue(self.channels_current[index])
 
         for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY):
-            if self.RigolDp832Thread.output_status_read(i) == OutputStates.ON:
-                self.channels_state[i] = True
-            if self.channels_state[i] is True:
-                self.channels_state_buttons[i].setStyleSheet(
-                    "background-color: rgb(85, 170, 127);\nborder-radius: 10px;\npadding: 10px; font: 75 11pt")
-                self.channels_state_buttons[i].setText(OutputStates.ON.value)
-
-            if self.RigolDp832Thread.ovp_status_read(i) == OutputProtectionStates.ON:
-                self.channels_ovp_state[i] = True
-            if self.channels_ovp_state[i] is True:
-                self.channels_ovp_state_buttons[i].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                self.channels_ovp_state_buttons[i].setText(OutputProtectionStates.ON.value)
-
-            if self.RigolDp832Thread.ocp_status_read(i) == OutputProtectionStates.ON:
-                self.channels_ocp_state[i] = True
-            if self.channels_ocp_state[i] is True:
-                self.channels_ocp_state_buttons[i].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                self.channels_ocp_state_buttons[i].setText(OutputProtectionStates.ON.value)
-            self.ovp_spinboxes[i].setValue(self.RigolDp832Thread.ovp_value_read(i))
-            self.ocp_spinboxes[i].setValue(self.RigolDp832Thread.ocp_value_read(i))
-
-    def cvcc_led_refresh(self):
-        """
-        Check if output mode of all channels changed
+            state = snapshot.channels[i]
+            self.channels_state[i] = state.output_state == OutputStates.ON
+            self.rigoldp832_view.output_render(i, self.channels_state[i])
+
+            self.channels_ovp_state[i] = state.ovp_state == OutputProtectionStates.ON
+            self.rigoldp832_view.ovp_render(i, self.channels_ovp_state[i])
+
+            self.channels_ocp_state[i] = state.ocp_state == OutputProtectionStates.ON
+            self.rigoldp832_view.ocp_render(i, self.channels_ocp_state[i])
+            if state.ovp_value is not None:
+                self.ovp_spinboxes[i].setValue(state.ovp_value)
+            if state.ocp_value is not None:
+                self.ocp_spinboxes[i].setValue(state.ocp_value)
+
+    def cvcc_led_refresh(self, modes: tuple):
         """
-        for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY):
-            if self.RigolDp832Thread.channels_mode[i] == OutputModes.CONSTANT_VOLTAGE:
-                self.channels_led[i].setPixmap(QPixmap(self.LED_DISABLED_PATH))
-                self.channels_cvcc_labels[i].setText(OutputModes.CONSTANT_VOLTAGE.value)
-            else:
-                self.channels_led[i].setPixmap(QPixmap(self.LED_ENABLED_PATH))
-                self.channels_cvcc_labels[i].setText(OutputModes.CONSTANT_CURRENT.value)
+        Show output mode of all channels
+        :param modes: RigolDP832OutputModes of all channels, index 0 holds first channel
+        """
+        self.rigoldp832_view.modes_render(modes)
+
+    @staticmethod
+    def limit_exceeded(value: float, limit: float) -> bool:
+        """
+        Compare setting with protection limit, settings are read from worker cache and may not be known yet
+        :param value: output voltage in [V] or current in [A], None if not known
+        :param limit: OVP value in [V] or OCP value in [A], None if not known
+        :return: True if both values are known and value is greater than limit
+        """
+        return value is not None and limit is not None and value > limit
 
     def channel_toggle_button_clicked(self, channel: int):
         """
@@ -378,8 +529,8 @@ class MainWindow(QMainWindow):
         """
         if self.channels_state[channel] is False:
             if self.channels_ovp_state[channel] and \
-                    self.RigolDp832Thread.output_voltage_value_get(channel) > \
-                    self.RigolDp832Thread.ovp_value_read(channel):
+                    self.limit_exceeded(self.RigolDp832Thread.output_voltage_value_get(channel),
+                                        self.RigolDp832Thread.ovp_value_read(channel)):
                 msg = QMessageBox()
                 msg.setIcon(QMessageBox.Warning)
                 msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -393,8 +544,8 @@ class MainWindow(QMainWindow):
                     self.channel_toggle_button_clicked(channel)
             else:
                 if self.channels_ocp_state[channel] and \
-                        self.RigolDp832Thread.output_current_value_get(channel) > \
-                        self.RigolDp832Thread.ocp_value_read(channel):
+                        self.limit_exceeded(self.RigolDp832Thread.output_current_value_get(channel),
+                                            self.RigolDp832Thread.ocp_value_read(channel)):
                     msg = QMessageBox()
                     msg.setIcon(QMessageBox.Warning)
                     msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -407,13 +558,11 @@ class MainWindow(QMainWindow):
                         self.channel_toggle_ocp_button_clicked(channel)
                         self.channel_toggle_button_clicked(channel)
                 else:
-                    self.channels_state_buttons[channel].setStyleSheet("background-color: rgb(85, 170, 127);\nborder-radius: 10px;\npadding: 10px; font: 75 11pt")
-                    self.channels_state_buttons[channel].setText(OutputStates.ON.value)
+                    self.rigoldp832_view.output_render(channel, True)
                     self.channels_state[channel] = True
                     self.toggle_channel.emit(True, channel+1)
         else:
-            self.channels_state_buttons[channel].setStyleSheet("background-color: #1f1d2c;\nborder-radius: 10px;\npadding: 10px; font: 75 11pt")
-            self.channels_state_buttons[channel].setText(OutputStates.OFF.value)
+            self.rigoldp832_view.output_render(channel, False)
             self.channels_state[channel] = False
             self.toggle_channel.emit(False, channel+1)
 
@@ -424,8 +573,8 @@ class MainWindow(QMainWindow):
         """
         if self.channels_ovp_state[channel] is False:
             if self.channels_state[channel] and \
-                    self.RigolDp832Thread.output_voltage_value_get(channel) > \
-                    self.ovp_spinboxes[channel].value():
+                    self.limit_exceeded(self.RigolDp832Thread.output_voltage_value_get(channel),
+                                        self.ovp_spinboxes[channel].value()):
                 msg = QMessageBox()
                 msg.setIcon(QMessageBox.Warning)
                 msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -436,18 +585,15 @@ class MainWindow(QMainWindow):
                 result = msg.exec_()
                 if result == QMessageBox.Ok:
                     self.channel_toggle_button_clicked(channel)
-                    self.channels_ovp_state_buttons[channel].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                    self.channels_ovp_state_buttons[channel].setText(OutputProtectionStates.ON.value)
+                    self.rigoldp832_view.ovp_render(channel, True)
                     self.channels_ovp_state[channel] = True
                     self.toggle_ovp.emit(True, channel+1, self.ovp_spinboxes[channel].value())
             else:
-                self.channels_ovp_state_buttons[channel].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                self.channels_ovp_state_buttons[channel].setText(OutputProtectionStates.ON.value)
+                self.rigoldp832_view.ovp_render(channel, True)
                 self.channels_ovp_state[channel] = True
                 self.toggle_ovp.emit(True, channel + 1, self.ovp_spinboxes[channel].value())
         else:
-            self.channels_ovp_state_buttons[channel].setStyleSheet(self.BUTTON_DISABLED_STYLESHEET)
-            self.channels_ovp_state_buttons[channel].setText(OutputProtectionStates.OFF.value)
+            self.rigoldp832_view.ovp_render(channel, False)
             self.channels_ovp_state[channel] = False
             self.toggle_ovp.emit(False, channel+1, self.ovp_spinboxes[channel].value())
 
@@ -458,8 +604,8 @@ class MainWindow(QMainWindow):
         """
         if self.channels_ocp_state[channel] is False:
             if self.channels_state[channel] and \
-                    self.RigolDp832Thread.output_current_value_get(channel) > \
-                    self.ocp_spinboxes[channel].value():
+                    self.limit_exceeded(self.RigolDp832Thread.output_current_value_get(channel),
+                                        self.ocp_spinboxes[channel].value()):
                 msg = QMessageBox()
                 msg.setIcon(QMessageBox.Warning)
                 msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -470,18 +616,15 @@ class MainWindow(QMainWindow):
                 result = msg.exec_()
                 if result == QMessageBox.Ok:
                     self.channel_toggle_button_clicked(channel)
-                    self.channels_ocp_state_buttons[channel].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                    self.channels_ocp_state_buttons[channel].setText(OutputProtectionStates.ON.value)
+                    self.rigoldp832_view.ocp_render(channel, True)
                     self.channels_ocp_state[channel] = True
                     self.toggle_ocp.emit(True, channel+1, self.ocp_spinboxes[channel].value())
             else:
-                self.channels_ocp_state_buttons[channel].setStyleSheet(self.BUTTON_ENABLED_STYLESHEET)
-                self.channels_ocp_state_buttons[channel].setText(OutputProtectionStates.ON.value)
+                self.rigoldp832_view.ocp_render(channel, True)
                 self.channels_ocp_state[channel] = True
                 self.toggle_ocp.emit(True, channel + 1, self.ocp_spinboxes[channel].value())
         else:
-            self.channels_ocp_state_buttons[channel].setStyleSheet(self.BUTTON_DISABLED_STYLESHEET)
-            self.channels_ocp_state_buttons[channel].setText(OutputProtectionStates.OFF.value)
+            self.rigoldp832_view.ocp_render(channel, False)
             self.channels_ocp_state[channel] = False
             self.toggle_ocp.emit(False, channel+1, self.ocp_spinboxes[channel].value())
 
@@ -490,10 +633,9 @@ class MainWindow(QMainWindow):
         Change value of voltage in [V] in channel output
         :param channel: specific channel to interact with
         """
-        self.set_timers[channel].stop()
         voltage = self.voltage_spinboxes[channel].value()
 
-        if self.channels_ovp_state[channel] and voltage > self.RigolDp832Thread.ovp_value_read(channel):
+        if self.channels_ovp_state[channel] and self.limit_exceeded(voltage, self.RigolDp832Thread.ovp_value_read(channel)):
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -518,7 +660,7 @@ class MainWindow(QMainWindow):
         """
         current = self.current_spinboxes[channel].value()
 
-        if self.channels_ocp_state[channel] and current > self.RigolDp832Thread.ocp_value_read(channel):
+        if self.channels_ocp_state[channel] and self.limit_exceeded(current, self.RigolDp832Thread.ocp_value_read(channel)):
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -544,7 +686,7 @@ class MainWindow(QMainWindow):
         limit = self.ovp_spinboxes[channel].value()
         if self.channels_ovp_state[channel] and \
                 self.channels_state[channel] and \
-                limit < self.RigolDp832Thread.output_voltage_value_get(channel):
+                self.limit_exceeded(self.RigolDp832Thread.output_voltage_value_get(channel), limit):
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -570,7 +712,7 @@ class MainWindow(QMainWindow):
         limit = self.ocp_spinboxes[channel].value()
         if self.channels_ocp_state[channel] and \
                 self.channels_state[channel] and \
-                limit < self.RigolDp832Thread.output_voltage_value_get(channel):
+                self.limit_exceeded(self.RigolDp832Thread.output_current_value_get(channel), limit):
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setWindowIcon(QIcon(self.THE_HEART_LOGO_PATH))
@@ -588,14 +730,22 @@ class MainWindow(QMainWindow):
         else:
             self.ocp_value_changed.emit(channel + 1, limit)
 
-    def overwrite_measured_values(self):
+    def overwrite_measured_values(self, measurement):
         """
-        Read values of Rigol DP832 thread object and overwrite it to ui elements
+        Store measurement sent by Rigol DP832 thread and overwrite it to ui elements
+        :param measurement: RigolDP832Measurement of all channels
         """
+        previous = self.rigoldp832_measurement
+        self.rigoldp832_measurement = measurement
+        self.plot_measurement_append(measurement)
+        self.rigoldp832_view.measurement_render(measurement)
         for i in range(self.RIGOL_DP832_CHANNELS_QUANTITY):
-            self.voltage_measure_pushbuttons[i].setText(f"{self.RigolDp832Thread.channels_voltage[i]} V")
-            self.current_measure_pushbuttons[i].setText(f"{self.RigolDp832Thread.channels_current[i]} A")
-            self.power_measure_pushbuttons[i].setText(f"{self.RigolDp832Thread.channels_power[i]} W")
+            # trips stay latched, output is shown OFF only when trip appears, so it can be turned ON again
+            tripped = (measurement.ovp_tripped[i] and not previous.ovp_tripped[i]) or \
+                (measurement.ocp_tripped[i] and not previous.ocp_tripped[i])
+            if tripped and self.channels_state[i] is True:
+                self.rigoldp832_view.output_render(i, False)
+                self.channels_state[i] = False
 
 
 if __name__ == '__main__':
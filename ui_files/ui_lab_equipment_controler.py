@@ -826,10 +826,10 @@ class Ui_MainWindow(object):
         self.horizontalLayout_7.addWidget(self.led_cvcc_3)
         self.gridLayout_channel_3.addLayout(self.horizontalLayout_7, 6, 0, 1, 1)
         self.horizontalLayout.addLayout(self.gridLayout_channel_3)
-        self.graphicsView = PlotWidget(self.tab_RigolDp832)
-        self.graphicsView.setGeometry(QtCore.QRect(30, 300, 951, 301))
-        self.graphicsView.setStyleSheet("color: rgb(239, 239, 239);")
-        self.graphicsView.setObjectName("graphicsView")
+        self.widget_plot_container = QtWidgets.QWidget(self.tab_RigolDp832)
+        self.widget_plot_container.setGeometry(QtCore.QRect(30, 300, 951, 301))
+        self.widget_plot_container.setStyleSheet("color: rgb(239, 239, 239);")
+        self.widget_plot_container.setObjectName("widget_plot_container")
         self.tabWidget.addTab(self.tab_RigolDp832, "")
         self.tab_Keithley2308 = QtWidgets.QWidget()
         self.tab_Keithley2308.setEnabled(True)
@@ -1005,4 +1005,3 @@ class Ui_MainWindow(object):
         self.settings_check_Multimeter_34401A.setText(_translate("MainWindow", "Multimeter 34401A"))
         self.settings_check_Siglent_SDG2122X.setText(_translate("MainWindow", "Siglent SDG2122X"))
         self.actionOpen_Drivers_Repository.setText(_translate("MainWindow", "Open Drivers Repository"))
-from pyqtgraph import PlotWidget